@@ -10,8 +10,10 @@ Usage:
 """
 
 import re
+import shlex
 import subprocess
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
 # Files that contain the version
@@ -19,11 +21,16 @@ PYPROJECT_PATH = Path(__file__).parent / "pyproject.toml"
 INIT_PATH = Path(__file__).parent / "src" / "internet_names_mcp" / "__init__.py"
 SERVER_PATH = Path(__file__).parent / "src" / "internet_names_mcp" / "server.py"
 
+VERSION_FILES = (PYPROJECT_PATH, INIT_PATH, SERVER_PATH)
+
+# Matches the version assignment in any of VERSION_FILES; group 1 is the value
+VERSION_RE = re.compile(r'^(?:version|__version__|VERSION)\s*=\s*"([^"]+)"', re.MULTILINE)
+
 
 def get_current_version() -> str:
     """Read current version from pyproject.toml."""
     content = PYPROJECT_PATH.read_text()
-    match = re.search(r'^version\s*=\s*"([^"]+)"', content, re.MULTILINE)
+    match = VERSION_RE.search(content)
     if not match:
         raise ValueError("Could not find version in pyproject.toml")
     return match.group(1)
@@ -53,43 +60,41 @@ def increment_version(current: str, bump: str) -> str:
         return bump
 
 
-def update_file(path: Path, pattern: str, replacement: str) -> bool:
-    """Update version in a file using regex substitution."""
-    content = path.read_text()
-    new_content, count = re.subn(pattern, replacement, content, flags=re.MULTILINE)
+def _write_version(path: Path, content: str, matches: list[re.Match], new_version: str) -> None:
+    """
+    Write the new version string into path.
 
-    if count == 0:
-        return False
+    When the new version is as long as the old one (e.g. 0.1.8 -> 0.1.9),
+    only the changed bytes are patched in place; otherwise the file is
+    rewritten.
+    """
+    if any(m.end(1) - m.start(1) != len(new_version) for m in matches):
+        for m in reversed(matches):
+            content = content[:m.start(1)] + new_version + content[m.end(1):]
+        path.write_bytes(content.encode())
+        return
 
-    path.write_text(new_content)
-    return True
+    data = new_version.encode()
+    with path.open("r+b") as f:
+        for m in matches:
+            f.seek(len(content[:m.start(1)].encode()))
+            f.write(data)
 
 
 def update_versions(new_version: str) -> None:
     """Update version in all relevant files."""
-    # Update pyproject.toml
-    if not update_file(
-        PYPROJECT_PATH,
-        r'^version\s*=\s*"[^"]+"',
-        f'version = "{new_version}"'
-    ):
-        raise ValueError("Failed to update version in pyproject.toml")
-
-    # Update __init__.py
-    if not update_file(
-        INIT_PATH,
-        r'^__version__\s*=\s*"[^"]+"',
-        f'__version__ = "{new_version}"'
-    ):
-        raise ValueError("Failed to update version in __init__.py")
-
-    # Update server.py
-    if not update_file(
-        SERVER_PATH,
-        r'^VERSION\s*=\s*"[^"]+"',
-        f'VERSION = "{new_version}"'
-    ):
-        raise ValueError("Failed to update version in server.py")
+    # Find everything first so a missing version leaves no file half-updated
+    updates = []
+    for path in VERSION_FILES:
+        # Decode bytes directly so match offsets map exactly onto the file
+        content = path.read_bytes().decode()
+        matches = list(VERSION_RE.finditer(content))
+        if not matches:
+            raise ValueError(f"Failed to update version in {path.name}")
+        updates.append((path, content, matches, new_version))
+
+    for update in updates:
+        _write_version(*update)
 
 
 def run(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
@@ -99,18 +104,8 @@ def run(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
 
 
 def check_dependencies() -> bool:
-    """Check that build and twine are installed."""
-    missing = []
-
-    try:
-        import build  # noqa: F401
-    except ImportError:
-        missing.append("build")
-
-    try:
-        import twine  # noqa: F401
-    except ImportError:
-        missing.append("twine")
+    """Check that build and twine are installed (without importing them)."""
+    missing = [name for name in ("build", "twine") if find_spec(name) is None]
 
     if missing:
         print(f"Error: Missing required packages: {', '.join(missing)}")
@@ -161,7 +156,7 @@ def main():
         # Filter out the files we're about to change
         changes = [
             line for line in result.stdout.strip().split("\n")
-            if line and not any(f in line for f in ["pyproject.toml", "__init__.py", "server.py"])
+            if line and not any(p.name in line for p in VERSION_FILES)
         ]
         if changes:
             print("\n  Warning: You have uncommitted changes:")
@@ -208,15 +203,22 @@ def main():
         sys.exit(1)
     print("  ✓ Uploaded to PyPI")
 
-    # Git commit
-    print("\nCommitting version bump...")
-    run(["git", "add", str(PYPROJECT_PATH), str(INIT_PATH), str(SERVER_PATH)])
-    run(["git", "commit", "-m", f"Bump version to {new_version}"])
+    # Git commit + push in a single shell session, script fed over stdin
+    print("\nCommitting and pushing version bump...")
+    files = " ".join(shlex.quote(str(p)) for p in VERSION_FILES)
+    message = shlex.quote(f"Bump version to {new_version}")
+    script = (
+        f"git add {files} || exit 1\n"
+        f"git commit -m {message} || exit 2\n"
+        "git push || exit 3\n"
+    )
+    print(f"  $ git add ... && git commit -m {message} && git push")
+    result = subprocess.run(["/bin/sh", "-s"], input=script, capture_output=True, text=True)
+    if result.returncode in (1, 2):
+        step = "Add" if result.returncode == 1 else "Commit"
+        print(f"  ✗ {step} failed: {result.stderr or result.stdout}")
+        sys.exit(1)
     print(f"  ✓ Committed")
-
-    # Git push
-    print("\nPushing to remote...")
-    result = run(["git", "push"], check=False)
     if result.returncode != 0:
         print(f"  ✗ Push failed: {result.stderr}")
         print("  You may need to push manually: git push")
@@ -6,33 +6,55 @@ An MCP server for checking availability of domain names, social media handles, a
 
 __version__ = "0.1.8"
 
+__all__ = ["main", "mcp", "__version__"]
+
+
+def __getattr__(name: str):
+    """Import the server module only when the mcp attribute is accessed."""
+    if name == "mcp":
+        from .server import mcp
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def main():
     """Main entry point for the CLI."""
     import sys
 
-    # Handle CLI arguments before importing heavy dependencies
-    if "--help" in sys.argv or "-h" in sys.argv:
-        print_help()
-        sys.exit(0)
+    argv = sys.argv
 
-    if "--version" in sys.argv or "-V" in sys.argv:
-        print(f"internet-names-mcp {__version__}")
-        sys.exit(0)
-
-    if "--setup" in sys.argv:
-        run_setup()
+    # Handle CLI arguments before importing heavy dependencies
+    # (checked in priority order when several flags are given)
+    commands = {
+        "--help": print_help,
+        "-h": print_help,
+        "--version": print_version,
+        "-V": print_version,
+        "--setup": run_setup,
+        "--show-config": show_config,
+    }
+
+    # Fast path: a single flag is the common case, dispatch on it directly
+    if len(argv) == 2 and (command := commands.get(argv[1])):
+        command()
         sys.exit(0)
 
-    if "--show-config" in sys.argv:
-        show_config()
-        sys.exit(0)
+    args = set(argv[1:])
+    for flag, command in commands.items():
+        if flag in args:
+            command()
+            sys.exit(0)
 
     # Default: run the MCP server
     from .server import mcp
     mcp.run()
 
 
+def print_version():
+    """Print the version."""
+    print(f"internet-names-mcp {__version__}")
+
+
 def print_help():
     """Print help message."""
     print(f"""internet-names-mcp {__version__}
@@ -65,7 +87,7 @@ Claude Code Setup:
 def run_setup():
     """Interactive setup wizard."""
     import getpass
-    from .config import get_namesilo_key, set_namesilo_key, get_config_file
+    from .config import resolve_key_info, set_namesilo_key
 
     print("=" * 50)
     print(f"Internet Names MCP v{__version__} - Setup")
@@ -78,7 +100,7 @@ def run_setup():
     print()
 
     # Check current API key status
-    current_key = get_namesilo_key()
+    current_key, _, config_file = resolve_key_info()
     if current_key:
         masked = mask_key(current_key)
         print(f"Current NameSilo API key: {masked}")
@@ -109,7 +131,7 @@ def run_setup():
             if sys.platform == "darwin":
                 print("\n✓ API key saved to macOS Keychain")
             else:
-                print(f"\n✓ API key saved to {get_config_file()}")
+                print(f"\n✓ API key saved to {config_file}")
             test_api_key(key)
         else:
             print("\n✗ Failed to save API key")
@@ -125,16 +147,15 @@ def run_setup():
 
 def show_config():
     """Show current configuration."""
-    from .config import get_namesilo_key, get_key_source
+    from .config import resolve_key_info
 
     print("Configuration")
     print("=" * 50)
     print()
 
-    key = get_namesilo_key()
+    key, source, _ = resolve_key_info()
     if key:
         masked = mask_key(key)
-        source = get_key_source()
         print(f"NameSilo API key: {masked}")
         print(f"  Source: {source}")
     else:
@@ -158,11 +179,13 @@ def check_playwright():
         from playwright.sync_api import sync_playwright
         print("  ✓ Playwright installed")
 
-        # Check for Chromium
+        # Check for Chromium on disk rather than launching it
         try:
+            from pathlib import Path
             with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                browser.close()
+                exe = p.chromium.executable_path
+            if not exe or not Path(exe).exists():
+                raise RuntimeError("Chromium executable missing")
             print("  ✓ Chromium browser available")
         except Exception:
             print("  ✗ Chromium not installed")
@@ -10,11 +10,16 @@ API key lookup order:
 3. Config file (fallback)
 """
 
+import functools
 import os
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 
+from . import jsonutil
+
 # Keychain service name
 KEYCHAIN_SERVICE = "internet-names-mcp.namesilo"
 KEYCHAIN_ACCOUNT = "namesilo"
@@ -25,11 +30,17 @@ def _is_macos() -> bool:
     return sys.platform == "darwin"
 
 
+# Path to the macOS `security` tool, resolved once (None off macOS)
+_SECURITY_BIN = shutil.which("security") if sys.platform == "darwin" else None
+
+
 def _keychain_get(service: str, account: str) -> str | None:
     """Get a password from macOS Keychain."""
+    if _SECURITY_BIN is None:
+        return None
     try:
         result = subprocess.run(
-            ["security", "find-generic-password", "-s", service, "-a", account, "-w"],
+            [_SECURITY_BIN, "find-generic-password", "-s", service, "-a", account, "-w"],
             capture_output=True,
             text=True
         )
@@ -42,15 +53,12 @@ def _keychain_get(service: str, account: str) -> str | None:
 
 def _keychain_set(service: str, account: str, password: str) -> bool:
     """Store a password in macOS Keychain."""
+    if _SECURITY_BIN is None:
+        return False
     try:
-        # Delete existing entry first (ignore errors)
-        subprocess.run(
-            ["security", "delete-generic-password", "-s", service, "-a", account],
-            capture_output=True
-        )
-        # Add new entry
+        # -U updates the entry in place if it already exists
         result = subprocess.run(
-            ["security", "add-generic-password", "-s", service, "-a", account, "-w", password, "-U"],
+            [_SECURITY_BIN, "add-generic-password", "-s", service, "-a", account, "-w", password, "-U"],
             capture_output=True
         )
         return result.returncode == 0
@@ -60,9 +68,11 @@ def _keychain_set(service: str, account: str, password: str) -> bool:
 
 def _keychain_delete(service: str, account: str) -> bool:
     """Delete a password from macOS Keychain."""
+    if _SECURITY_BIN is None:
+        return False
     try:
         result = subprocess.run(
-            ["security", "delete-generic-password", "-s", service, "-a", account],
+            [_SECURITY_BIN, "delete-generic-password", "-s", service, "-a", account],
             capture_output=True,
             text=True
         )
@@ -71,6 +81,7 @@ def _keychain_delete(service: str, account: str) -> bool:
         return False
 
 
+@functools.cache
 def get_config_dir() -> Path:
     """Get the config directory for this app."""
     if os.name == 'nt':  # Windows
@@ -82,41 +93,89 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+@functools.cache
 def get_config_file() -> Path:
     """Get the path to the config file."""
     return get_config_dir() / 'config.json'
 
 
-def get_namesilo_key() -> str | None:
+def get_cache_dir() -> Path:
+    """Get the cache directory for this app, creating it if needed."""
+    if os.name == 'nt':  # Windows
+        base = Path(os.environ.get('APPDATA', Path.home()))
+    else:  # macOS, Linux
+        base = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+
+    cache_dir = base / 'internet-names-mcp'
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+# How long a resolved key (and its source) is reused before re-checking
+KEY_CACHE_TTL = 60.0
+
+# (key, source, resolved_at) from the last lookup
+_key_cache: tuple[str | None, str | None, float] | None = None
+
+
+def _resolve_key() -> tuple[str | None, str | None]:
     """
-    Get NameSilo API key from available sources.
+    Find the NameSilo API key and where it came from.
 
     Lookup order:
     1. macOS Keychain (if on macOS)
     2. Environment variable (NAMESILO_API_KEY)
     3. Config file (fallback for non-macOS or legacy)
     """
+    global _key_cache
+    if _key_cache is not None:
+        key, source, resolved_at = _key_cache
+        if time.monotonic() - resolved_at < KEY_CACHE_TTL:
+            return key, source
+
+    key, source = _lookup_key()
+    _key_cache = (key, source, time.monotonic())
+    return key, source
+
+
+def _lookup_key() -> tuple[str | None, str | None]:
+    """Query every key source in order (uncached)."""
     # 1. Try macOS Keychain first
     if _is_macos():
         if key := _keychain_get(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT):
-            return key
+            return key, "macOS Keychain"
 
     # 2. Check environment variable
     if key := os.environ.get('NAMESILO_API_KEY'):
-        return key
+        return key, "environment variable"
 
     # 3. Check config file (fallback)
     try:
-        import json
         config_file = get_config_file()
         if config_file.exists():
-            config = json.loads(config_file.read_text())
+            config = jsonutil.loads(config_file.read_bytes())
             if key := config.get('namesilo_api_key'):
-                return key
-    except (json.JSONDecodeError, OSError):
+                return key, "config file"
+    except (ValueError, OSError):
         pass
 
-    return None
+    return None, None
+
+
+def get_namesilo_key() -> str | None:
+    """
+    Get NameSilo API key from available sources.
+
+    The result is cached for KEY_CACHE_TTL seconds so repeated calls don't
+    each query the keychain; call invalidate_key_cache() after changing it.
+    """
+    return _resolve_key()[0]
+
+
+def invalidate_key_cache() -> None:
+    """Forget the cached API key so the next lookup re-reads it."""
+    global _key_cache
+    _key_cache = None
 
 
 def set_namesilo_key(key: str) -> bool:
@@ -126,6 +185,7 @@ def set_namesilo_key(key: str) -> bool:
     On macOS: Uses Keychain.
     On other platforms: Uses config file.
     """
+    invalidate_key_cache()
     if _is_macos():
         return _keychain_set(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT, key)
     else:
@@ -139,12 +199,12 @@ def set_namesilo_key(key: str) -> bool:
             config = {}
             if config_file.exists():
                 try:
-                    config = json.loads(config_file.read_text())
-                except json.JSONDecodeError:
+                    config = jsonutil.loads(config_file.read_bytes())
+                except ValueError:
                     pass
 
             config['namesilo_api_key'] = key
-            config_file.write_text(json.dumps(config, indent=2))
+            jsonutil.write_atomic(config_file, json.dumps(config, indent=2))
             return True
         except OSError:
             return False
@@ -152,6 +212,7 @@ def set_namesilo_key(key: str) -> bool:
 
 def delete_namesilo_key() -> bool:
     """Remove NameSilo API key."""
+    invalidate_key_cache()
     if _is_macos():
         return _keychain_delete(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT)
     else:
@@ -159,32 +220,26 @@ def delete_namesilo_key() -> bool:
             import json
             config_file = get_config_file()
             if config_file.exists():
-                config = json.loads(config_file.read_text())
+                config = jsonutil.loads(config_file.read_bytes())
                 if 'namesilo_api_key' in config:
                     del config['namesilo_api_key']
-                    config_file.write_text(json.dumps(config, indent=2))
+                    jsonutil.write_atomic(config_file, json.dumps(config, indent=2))
             return True
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             return False
 
 
 def get_key_source() -> str | None:
     """Determine where the API key is stored (for display purposes)."""
-    if _is_macos():
-        if _keychain_get(KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT):
-            return "macOS Keychain"
+    return _resolve_key()[1]
 
-    if os.environ.get('NAMESILO_API_KEY'):
-        return "environment variable"
 
-    try:
-        import json
-        config_file = get_config_file()
-        if config_file.exists():
-            config = json.loads(config_file.read_text())
-            if config.get('namesilo_api_key'):
-                return "config file"
-    except (json.JSONDecodeError, OSError):
-        pass
+def resolve_key_info() -> tuple[str | None, str | None, Path]:
+    """
+    Resolve everything the CLI displays about the API key in one pass.
 
-    return None
+    Returns:
+        (key, source, config file path); key and source are None if unset.
+    """
+    key, source = _resolve_key()
+    return key, source, get_config_file()
@@ -0,0 +1,53 @@
+"""
+JSON helpers
+
+Uses orjson when it is installed (pip install internet-names-mcp[speedups])
+and falls back to the standard library otherwise. Both functions work with
+str, matching the json module's interface.
+
+write_atomic() replaces a JSON file without ever leaving it half-written.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj) -> str:
+    """Serialize obj to a compact JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: str | bytes):
+    """Parse a JSON document. Raises ValueError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """
+    Write text to path via a temporary file and os.replace, so readers see
+    either the old contents or the new ones. Raises OSError on failure.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,145 @@
+"""
+Lookup Result Cache Module
+
+Persists availability lookups (domains, handles, subreddits) in a small SQLite
+database so repeated checks of the same candidate names within the TTL
+skip the network entirely.
+
+Set INTERNET_NAMES_NO_CACHE=1 to disable the cache, or
+INTERNET_NAMES_CACHE_TTL=<seconds> to override every TTL.
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from . import jsonutil
+from .config import get_cache_dir
+
+# Default TTLs (seconds) per kind of lookup
+DOMAIN_CACHE_TTL = 86400  # 24 hours (taken domains rarely free up)
+AVAILABLE_DOMAIN_CACHE_TTL = 3600  # 1 hour (available ones can be registered)
+SUBREDDIT_CACHE_TTL = 3600  # 1 hour
+HANDLE_CACHE_TTL = 300  # 5 minutes
+
+CACHE_ENABLED = not os.environ.get("INTERNET_NAMES_NO_CACHE")
+
+
+def _get_cache_path() -> Path:
+    """Get the cache database path in user's cache directory."""
+    return get_cache_dir() / 'lookups.sqlite3'
+
+
+def _ttl_override() -> float | None:
+    """Parse INTERNET_NAMES_CACHE_TTL, returning None if unset or invalid."""
+    value = os.environ.get("INTERNET_NAMES_CACHE_TTL")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+_connection: sqlite3.Connection | None = None
+
+
+def _get_connection() -> sqlite3.Connection | None:
+    """Open (once) and return the cache database, or None if unavailable."""
+    global _connection
+    if _connection is not None:
+        return _connection
+
+    try:
+        conn = sqlite3.connect(_get_cache_path(), timeout=5, check_same_thread=False)
+        # WAL lets concurrent server processes read while another writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS lookups ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.commit()
+    except (sqlite3.Error, OSError):
+        return None
+
+    _connection = conn
+    return conn
+
+
+def _make_key(kind: str, name: str) -> str:
+    return f"{kind}:{name}"
+
+
+def get_many(kind: str, names: list[str]) -> dict[str, dict]:
+    """
+    Look up cached results.
+
+    Args:
+        kind: Lookup kind, e.g. "rdap", "namesilo", "handle", "subreddit"
+        names: Names to look up
+
+    Returns:
+        Mapping of name -> cached value for every unexpired hit.
+    """
+    if not CACHE_ENABLED or not names:
+        return {}
+
+    conn = _get_connection()
+    if conn is None:
+        return {}
+
+    keys = {_make_key(kind, name): name for name in names}
+    key_list = list(keys)
+    now = time.time()
+    rows = []
+    try:
+        # Stay well under SQLite's bound-parameter limit
+        for i in range(0, len(key_list), 500):
+            chunk = key_list[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows.extend(conn.execute(
+                f"SELECT key, value FROM lookups WHERE expires_at > ? AND key IN ({placeholders})",
+                (now, *chunk),
+            ).fetchall())
+    except sqlite3.Error:
+        return {}
+
+    hits = {}
+    for key, value in rows:
+        try:
+            hits[keys[key]] = jsonutil.loads(value)
+        except ValueError:
+            pass
+    return hits
+
+
+def put_many(kind: str, values: dict[str, dict], ttl: float) -> None:
+    """
+    Store results in the cache.
+
+    Args:
+        kind: Lookup kind, e.g. "rdap", "namesilo", "handle", "subreddit"
+        values: Mapping of name -> JSON-serializable result
+        ttl: Time to live in seconds (overridden by INTERNET_NAMES_CACHE_TTL)
+    """
+    if not CACHE_ENABLED or not values:
+        return
+
+    conn = _get_connection()
+    if conn is None:
+        return
+
+    override = _ttl_override()
+    expires_at = time.time() + (override if override is not None else ttl)
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO lookups (key, value, expires_at) VALUES (?, ?, ?)",
+                [
+                    (_make_key(kind, name), jsonutil.dumps(value), expires_at)
+                    for name, value in values.items()
+                ],
+            )
+    except sqlite3.Error:
+        pass
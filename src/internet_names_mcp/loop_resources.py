@@ -0,0 +1,94 @@
+"""
+Event Loop Resources Module
+
+Keeps long-lived async resources (HTTP clients, the X.com browser) per event
+loop, so connection pools are reused across tool calls without being shared
+between loops.
+
+Resources are closed when their loop shuts down: a small keeper task is
+cancelled by asyncio.run() (and anyio.run()) at exit and closes everything
+registered on that loop. Loops that are never shut down that way, such as a
+run_forever() loop on a daemon thread, can call aclose_all() themselves.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class _LoopResources:
+    """Resources opened on one event loop, plus the task that closes them."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.items: dict[Hashable, tuple[Any, Callable[[Any], Awaitable[None]]]] = {}
+        self.keeper = loop.create_task(self._close_at_shutdown(loop))
+
+    async def _close_at_shutdown(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            await loop.create_future()  # Never set; cancelled on loop shutdown
+        finally:
+            with _registries_lock:
+                if _registries.get(loop) is self:
+                    del _registries[loop]
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close every resource (most recently opened first), ignoring errors."""
+        items = list(self.items.values())
+        self.items.clear()
+        for resource, close in reversed(items):
+            try:
+                await close(resource)
+            except Exception:
+                pass
+
+
+# One registry per loop. Each registry's keeper task refers to its loop, so
+# entries are removed explicitly (at shutdown, or once the loop is closed).
+_registries: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopResources]" = (
+    weakref.WeakKeyDictionary()
+)
+# Loops on different threads (the server's and a sync wrapper's) share it
+_registries_lock = threading.Lock()
+
+
+def get(
+    key: Hashable,
+    factory: Callable[[], T],
+    close: Callable[[T], Awaitable[None]],
+    is_closed: Callable[[T], bool] | None = None,
+) -> T:
+    """
+    Return the running loop's resource for key, creating it if needed.
+
+    Args:
+        key: Identifies the resource within the loop
+        factory: Creates the resource
+        close: Coroutine function that closes it at loop shutdown
+        is_closed: Optional check; a closed resource is replaced by a new one
+    """
+    loop = asyncio.get_running_loop()
+    with _registries_lock:
+        registry = _registries.get(loop)
+        if registry is None:
+            for stale in [l for l in _registries if l.is_closed()]:
+                del _registries[stale]  # Closed without shutting down; nothing to await
+            registry = _registries[loop] = _LoopResources(loop)
+
+    entry = registry.items.get(key)
+    if entry is None or (is_closed is not None and is_closed(entry[0])):
+        entry = registry.items[key] = (factory(), close)
+    return entry[0]
+
+
+async def aclose_all() -> None:
+    """Close the running loop's resources now (they are recreated on demand)."""
+    with _registries_lock:
+        registry = _registries.pop(asyncio.get_running_loop(), None)
+    if registry is not None:
+        registry.keeper.cancel()
+        await registry.aclose()
@@ -7,27 +7,24 @@ registry queries instead of using rdap.org as a proxy.
 The bootstrap file maps TLDs to their authoritative RDAP servers.
 """
 
-import json
-import os
+import atexit
+import hashlib
 import time
+from collections.abc import Iterable
 from pathlib import Path
 
 import httpx
 
+from . import jsonutil
+from .config import get_cache_dir
+
 # IANA bootstrap URL
 IANA_BOOTSTRAP_URL = "https://data.iana.org/rdap/dns.json"
 
 
 def _get_cache_path() -> Path:
-    """Get the cache file path in user's config directory."""
-    if os.name == 'nt':  # Windows
-        base = Path(os.environ.get('APPDATA', Path.home()))
-    else:  # macOS, Linux
-        base = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
-
-    cache_dir = base / 'internet-names-mcp'
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir / 'rdap_bootstrap.json'
+    """Get the cache file path in user's cache directory."""
+    return get_cache_dir() / 'rdap_bootstrap.json'
 
 
 # Cache file location
@@ -36,37 +33,70 @@ BOOTSTRAP_CACHE_PATH = _get_cache_path()
 # Default cache expiry if no Cache-Control header (24 hours)
 DEFAULT_CACHE_TTL = 86400
 
+# Shared client for IANA requests, created on first refresh
+_http_client: httpx.Client | None = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            http2=True,
+            timeout=30,
+            headers={"User-Agent": "InternetNamesMCP/1.0 (RDAP Bootstrap)"},
+        )
+        atexit.register(_http_client.close)
+    return _http_client
+
+
+# Parsed copy of the cache file, reused while the file's mtime is unchanged
+_mem_cache: dict | None = None
+_mem_cache_mtime: int | None = None
+
 
 def _load_cache() -> dict | None:
     """Load cache from disk, returning None if not found or invalid."""
+    global _mem_cache, _mem_cache_mtime
     try:
-        if BOOTSTRAP_CACHE_PATH.exists():
-            with open(BOOTSTRAP_CACHE_PATH, "r") as f:
-                return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        pass
-    return None
+        mtime = BOOTSTRAP_CACHE_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    if mtime == _mem_cache_mtime:
+        return _mem_cache
+
+    try:
+        cache = jsonutil.loads(BOOTSTRAP_CACHE_PATH.read_bytes())
+    except (ValueError, OSError):
+        return None
+
+    _mem_cache, _mem_cache_mtime = cache, mtime
+    return cache
 
 
 def _save_cache(cache: dict) -> bool:
     """Save cache to disk. Returns True on success."""
+    global _mem_cache, _mem_cache_mtime
     try:
-        with open(BOOTSTRAP_CACHE_PATH, "w") as f:
-            json.dump(cache, f, indent=2)
+        jsonutil.write_atomic(BOOTSTRAP_CACHE_PATH, jsonutil.dumps(cache))
+        _mem_cache, _mem_cache_mtime = cache, BOOTSTRAP_CACHE_PATH.stat().st_mtime_ns
         return True
     except OSError:
         return False
 
 
 def _parse_max_age(cache_control: str) -> int | None:
-    """Parse max-age from Cache-Control header."""
+    """Parse max-age from Cache-Control header (token or quoted form)."""
     for directive in cache_control.split(","):
-        directive = directive.strip().lower()
-        if directive.startswith("max-age="):
+        name, _, value = directive.partition("=")
+        if name.strip().lower() == "max-age":
             try:
-                return int(directive[8:])
+                max_age = int(value.strip().strip('"'))
             except ValueError:
-                pass
+                continue
+            if max_age >= 0:
+                return max_age
     return None
 
 
@@ -83,15 +113,13 @@ def _parse_bootstrap_services(data: dict) -> dict[str, list[str]]:
         ]
     }
     """
-    services = {}
-    for entry in data.get("services", []):
-        if len(entry) >= 2:
-            tlds = entry[0]
-            urls = entry[1]
-            for tld in tlds:
-                tld_lower = tld.lower()
-                services[tld_lower] = urls
-    return services
+    # Every TLD in an entry shares the same URL list
+    return {
+        tld.lower(): entry[1]
+        for entry in data.get("services", ())
+        if len(entry) >= 2 and entry[1]
+        for tld in entry[0]
+    }
 
 
 def refresh_bootstrap(force: bool = False) -> bool:
@@ -116,10 +144,7 @@ def refresh_bootstrap(force: bool = False) -> bool:
             return False  # Cache still valid
 
     # Build request headers for conditional GET
-    headers = {
-        "Accept": "application/json",
-        "User-Agent": "InternetNamesMCP/1.0 (RDAP Bootstrap)",
-    }
+    headers = {"Accept": "application/json"}
     if cache:
         if cache.get("last_modified"):
             headers["If-Modified-Since"] = cache["last_modified"]
@@ -127,7 +152,7 @@ def refresh_bootstrap(force: bool = False) -> bool:
             headers["If-None-Match"] = cache["etag"]
 
     try:
-        response = httpx.get(IANA_BOOTSTRAP_URL, headers=headers, timeout=30)
+        response = _get_http_client().get(IANA_BOOTSTRAP_URL, headers=headers)
     except httpx.HTTPError:
         # Network error - use stale cache if available
         return False
@@ -145,24 +170,36 @@ def refresh_bootstrap(force: bool = False) -> bool:
         return False
 
     if response.status_code == 200:
+        # Calculate expiry from Cache-Control
+        cache_control = response.headers.get("Cache-Control", "")
+        max_age = _parse_max_age(cache_control)
+        expires = time.time() + (max_age if max_age else DEFAULT_CACHE_TTL)
+
+        content_hash = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+        if cache and cache.get("services") and cache.get("content_hash") == content_hash:
+            # Same body as before (server ignored our validators) - keep the
+            # parsed services; persist the new expiry and validators so the
+            # next refresh can get a 304
+            cache["expires"] = expires
+            cache["last_modified"] = response.headers.get("Last-Modified", "")
+            cache["etag"] = response.headers.get("ETag", "")
+            _save_cache(cache)
+            return False
+
         # Parse and cache new bootstrap data
         try:
-            data = response.json()
-        except json.JSONDecodeError:
+            data = jsonutil.loads(response.content)
+        except ValueError:
             return False
 
         services = _parse_bootstrap_services(data)
         if not services:
             return False  # Invalid data
 
-        # Calculate expiry from Cache-Control
-        cache_control = response.headers.get("Cache-Control", "")
-        max_age = _parse_max_age(cache_control)
-        expires = time.time() + (max_age if max_age else DEFAULT_CACHE_TTL)
-
         new_cache = {
             "last_modified": response.headers.get("Last-Modified", ""),
             "etag": response.headers.get("ETag", ""),
+            "content_hash": content_hash,
             "expires": expires,
             "services": services,
         }
@@ -173,6 +210,35 @@ def refresh_bootstrap(force: bool = False) -> bool:
     return False
 
 
+def _get_current_cache() -> dict | None:
+    """Load the bootstrap cache, refreshing it first if it has expired."""
+    cache = _load_cache()
+
+    if not cache or time.time() >= cache.get("expires", 0):
+        refresh_bootstrap()
+        cache = _load_cache()
+
+    return cache
+
+
+# (cache dict, supported TLDs, sorted supported TLDs) derived from the
+# in-memory cache; rebuilt whenever _load_cache() returns a new dict
+_tld_index: tuple[dict, frozenset[str], list[str]] | None = None
+
+
+def _get_tld_index() -> tuple[frozenset[str], list[str]]:
+    """Return the supported TLDs as a set and as a sorted list."""
+    global _tld_index
+    cache = _get_current_cache()
+    if not cache:
+        return frozenset(), []
+
+    if _tld_index is None or _tld_index[0] is not cache:
+        tlds = frozenset(tld for tld, urls in cache.get("services", {}).items() if urls)
+        _tld_index = (cache, tlds, sorted(tlds))
+    return _tld_index[1], _tld_index[2]
+
+
 def get_rdap_server(tld: str) -> str | None:
     """
     Get the RDAP server URL for a given TLD.
@@ -186,13 +252,7 @@ def get_rdap_server(tld: str) -> str | None:
         The RDAP server URL (e.g. "https://rdap.verisign.com/com/v1/"),
         or None if the TLD is not in the bootstrap.
     """
-    # Ensure cache is loaded/refreshed
-    cache = _load_cache()
-
-    if not cache or time.time() >= cache.get("expires", 0):
-        refresh_bootstrap()
-        cache = _load_cache()
-
+    cache = _get_current_cache()
     if not cache:
         return None
 
@@ -206,6 +266,27 @@ def get_rdap_server(tld: str) -> str | None:
     return None
 
 
+def get_rdap_servers(tlds: Iterable[str]) -> dict[str, str | None]:
+    """
+    Get RDAP server URLs for several TLDs with a single cache load.
+
+    Args:
+        tlds: Iterable of top-level domains (without leading dot)
+
+    Returns:
+        Mapping of each given TLD to its RDAP server URL, or None if the
+        TLD is not in the bootstrap.
+    """
+    cache = _get_current_cache()
+    services = cache.get("services", {}) if cache else {}
+
+    servers = {}
+    for tld in tlds:
+        urls = services.get(tld.lower())
+        servers[tld] = urls[0] if urls else None
+    return servers
+
+
 def is_tld_supported(tld: str) -> bool:
     """
     Check if a TLD is supported by RDAP (has an entry in the bootstrap).
@@ -216,7 +297,7 @@ def is_tld_supported(tld: str) -> bool:
     Returns:
         True if the TLD has RDAP support, False otherwise.
     """
-    return get_rdap_server(tld) is not None
+    return tld.lower() in _get_tld_index()[0]
 
 
 def get_supported_tlds() -> list[str]:
@@ -226,14 +307,4 @@ def get_supported_tlds() -> list[str]:
     Returns:
         List of TLD strings, sorted alphabetically.
     """
-    # Ensure cache is loaded/refreshed
-    cache = _load_cache()
-
-    if not cache or time.time() >= cache.get("expires", 0):
-        refresh_bootstrap()
-        cache = _load_cache()
-
-    if not cache:
-        return []
-
-    return sorted(cache.get("services", {}).keys())
+    return list(_get_tld_index()[1])
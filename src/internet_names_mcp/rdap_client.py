@@ -6,16 +6,19 @@ exponential backoff, and correct error categorization.
 """
 
 import asyncio
+import functools
 import random
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
-from email.utils import parsedate_to_datetime
 from enum import Enum
 from urllib.parse import urlparse
 
 import httpx
 
-from .rdap_bootstrap import get_rdap_server
+from . import loop_resources
+from .rdap_bootstrap import get_rdap_server, get_rdap_servers
 
 
 class DomainStatus(Enum):
@@ -27,7 +30,7 @@ class DomainStatus(Enum):
     UNSUPPORTED = "unsupported"  # TLD not in bootstrap
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DomainResult:
     """Result of a domain availability check with proper error categorization."""
 
@@ -49,7 +52,19 @@ class DomainResult:
         return self.error_message
 
 
-@dataclass
+# Bound once: the limiter calls these for every request
+_monotonic = time.monotonic
+_sleep = asyncio.sleep
+_random = random.random
+
+# RDAP responses that settle a domain's status without retrying
+_TERMINAL_STATUSES = {
+    404: DomainStatus.AVAILABLE,  # not registered
+    200: DomainStatus.UNAVAILABLE,  # registration record exists
+}
+
+
+@dataclass(slots=True)
 class HostRateLimiter:
     """Per-host rate limiter with concurrency control and backoff."""
 
@@ -58,34 +73,25 @@ class HostRateLimiter:
     min_delay: float = 0.5
 
     _semaphore: asyncio.Semaphore = field(init=False, repr=False)
-    _last_request_time: float = field(default=0.0, init=False)
+    _next_slot: float = field(default=0.0, init=False)
     _retry_after_until: float = field(default=0.0, init=False)
     _consecutive_rate_limits: int = field(default=0, init=False)
-    _lock: asyncio.Lock = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._semaphore = asyncio.Semaphore(self.max_concurrent)
-        self._lock = asyncio.Lock()
 
     async def acquire(self) -> None:
         """Acquire permission to make a request to this host."""
         await self._semaphore.acquire()
 
-        async with self._lock:
-            now = time.monotonic()
-
-            # Honor retry_after from previous 429 response
-            if now < self._retry_after_until:
-                wait_time = self._retry_after_until - now
-                await asyncio.sleep(wait_time)
-                now = time.monotonic()
-
-            # Enforce minimum delay between requests
-            elapsed = now - self._last_request_time
-            if elapsed < self.min_delay:
-                await asyncio.sleep(self.min_delay - elapsed)
-
-            self._last_request_time = time.monotonic()
+        # Reserve the next send slot (honoring min_delay and any retry_after
+        # from a previous 429) before sleeping. Nothing awaits between the
+        # read and the write, so no lock is needed on the event loop.
+        now = _monotonic()
+        start = max(now, self._next_slot, self._retry_after_until)
+        self._next_slot = start + self.min_delay
+        if start > now:
+            await _sleep(start - now)
 
     def release(
         self, rate_limited: bool = False, retry_after: float | None = None
@@ -95,12 +101,12 @@ class HostRateLimiter:
             self._consecutive_rate_limits += 1
             if retry_after is not None:
                 # Use server-provided Retry-After
-                self._retry_after_until = time.monotonic() + retry_after
+                self._retry_after_until = _monotonic() + retry_after
             else:
                 # Exponential backoff with jitter: 2^n seconds, max 32s
                 backoff = min(2**self._consecutive_rate_limits, 32)
-                jitter = backoff * 0.25 * (random.random() * 2 - 1)  # +/- 25%
-                self._retry_after_until = time.monotonic() + backoff + jitter
+                jitter = backoff * 0.25 * (_random() * 2 - 1)  # +/- 25%
+                self._retry_after_until = _monotonic() + backoff + jitter
         else:
             # Successful request resets consecutive rate limit counter
             self._consecutive_rate_limits = 0
@@ -134,6 +140,30 @@ class RateLimiterRegistry:
             return self._limiters[host]
 
 
+def _get_tld(domain: str) -> str:
+    """Return the lowercased TLD of a domain ("" if it has none)."""
+    _, sep, tld = domain.rpartition(".")
+    return tld.lower() if sep else ""
+
+
+@functools.lru_cache(maxsize=256)
+def _unsupported_message(tld: str) -> str:
+    """Error message for a TLD missing from the RDAP bootstrap (built once per TLD)."""
+    return f"TLD .{tld} not in RDAP bootstrap"
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_http_date(value: str) -> float | None:
+    """Parse an HTTP date to a Unix timestamp (cached; the result is absolute)."""
+    # Deferred: only needed for the rare date-style Retry-After
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (ValueError, TypeError):
+        return None
+
+
 def _parse_retry_after(header: str | None) -> float | None:
     """
     Parse Retry-After header value.
@@ -147,21 +177,20 @@ def _parse_retry_after(header: str | None) -> float | None:
 
     header = header.strip()
 
-    # Try parsing as integer (seconds)
+    # Integer seconds is by far the most common form
+    if header.isdigit():
+        return float(header)
+
     try:
         return float(header)
     except ValueError:
         pass
 
     # Try parsing as HTTP date
-    try:
-        dt = parsedate_to_datetime(header)
-        delta = dt.timestamp() - time.time()
-        return max(0.0, delta)
-    except (ValueError, TypeError):
-        pass
-
-    return None
+    timestamp = _parse_http_date(header)
+    if timestamp is None:
+        return None
+    return max(0.0, timestamp - time.time())
 
 
 class AsyncRDAPClient:
@@ -182,6 +211,7 @@ class AsyncRDAPClient:
     ) -> None:
         self._timeout = timeout
         self._max_retries = max_retries
+        self._max_concurrent_per_host = max_concurrent_per_host
         self._client: httpx.AsyncClient | None = None
         self._registry = RateLimiterRegistry(
             max_concurrent=max_concurrent_per_host,
@@ -189,13 +219,17 @@ class AsyncRDAPClient:
         )
 
     async def __aenter__(self) -> "AsyncRDAPClient":
+        # HTTP/2 lets concurrent queries to one registry share a single
+        # connection (one TLS handshake per host)
         self._client = httpx.AsyncClient(
+            http2=True,
             timeout=self._timeout,
             headers={"Accept": "application/rdap+json"},
             follow_redirects=True,
             limits=httpx.Limits(
                 max_connections=100,
                 max_keepalive_connections=20,
+                keepalive_expiry=60.0,
             ),
         )
         return self
@@ -207,20 +241,19 @@ class AsyncRDAPClient:
 
     async def _check_single(self, domain: str) -> DomainResult:
         """Check a single domain with retries and rate limiting."""
+        return await self._check_with_server(domain, get_rdap_server(_get_tld(domain)))
+
+    async def _check_with_server(self, domain: str, rdap_server: str | None) -> DomainResult:
+        """Check a single domain against an already-resolved RDAP server."""
         if self._client is None:
             raise RuntimeError("Client not initialized. Use 'async with' context.")
 
-        # Extract TLD
-        tld = domain.rsplit(".", 1)[-1].lower() if "." in domain else ""
-
-        # Get RDAP server from bootstrap
-        rdap_server = get_rdap_server(tld)
         if not rdap_server:
             return DomainResult(
                 domain=domain,
                 status=DomainStatus.UNSUPPORTED,
                 error_type="tld_unsupported",
-                error_message=f"TLD .{tld} not in RDAP bootstrap",
+                error_message=_unsupported_message(_get_tld(domain)),
             )
 
         # Ensure server URL ends with /
@@ -244,13 +277,10 @@ class AsyncRDAPClient:
             try:
                 response = await self._client.get(url)
 
-                if response.status_code == 404:
-                    limiter.release(rate_limited=False)
-                    return DomainResult(domain=domain, status=DomainStatus.AVAILABLE)
-
-                if response.status_code == 200:
+                status = _TERMINAL_STATUSES.get(response.status_code)
+                if status is not None:
                     limiter.release(rate_limited=False)
-                    return DomainResult(domain=domain, status=DomainStatus.UNAVAILABLE)
+                    return DomainResult(domain, status)
 
                 if response.status_code == 429:
                     retry_after = _parse_retry_after(
@@ -262,11 +292,7 @@ class AsyncRDAPClient:
                     last_error = None
                     limiter.release(rate_limited=True, retry_after=retry_after)
 
-                    # Continue to next retry attempt
-                    if attempt < self._max_retries - 1:
-                        # Wait before retry (limiter will also wait)
-                        wait_time = retry_after if retry_after else 0.5 * (attempt + 1)
-                        await asyncio.sleep(wait_time)
+                    # Retry; the limiter's next acquire() waits out the backoff
                     continue
 
                 # Other status codes are errors
@@ -313,20 +339,104 @@ class AsyncRDAPClient:
             retry_after=last_retry_after,
         )
 
-    async def check_domains(self, domains: list[str]) -> list[DomainResult]:
+    async def _check_grouped(
+        self,
+        domains: list[str],
+        emit: Callable[[int, DomainResult], None],
+        group_key: Callable[[str], str] | None = None,
+    ) -> None:
+        """
+        Check domains with one small worker pool per RDAP host.
+
+        Domains are grouped by their RDAP server host, and each host gets its
+        own pool of workers (max_concurrent_per_host) that work through that
+        host's domains, so only requests that can actually run are waiting on
+        the host's rate limiter. emit(index, result) is called as each domain
+        finishes.
+
+        If group_key is given, domains sharing a key are treated as a group:
+        once any of them comes back not available, the group's remaining
+        domains are skipped and never emitted.
+        """
+        # Resolve every TLD's RDAP server from one bootstrap load per batch
+        servers = get_rdap_servers({_get_tld(d) for d in domains})
+        failed_groups: set[str] = set()
+
+        def record(i: int, result: DomainResult) -> None:
+            if group_key and result.status is not DomainStatus.AVAILABLE:
+                failed_groups.add(group_key(result.domain))
+            emit(i, result)
+
+        by_host: dict[str, deque[int]] = {}
+        for i, domain in enumerate(domains):
+            server = servers[_get_tld(domain)]
+            if server:
+                by_host.setdefault(urlparse(server).netloc.lower(), deque()).append(i)
+            else:
+                record(i, await self._check_with_server(domain, None))
+
+        async def worker(queue: deque[int]) -> None:
+            while queue:
+                i = queue.popleft()
+                domain = domains[i]
+                if group_key and group_key(domain) in failed_groups:
+                    continue
+                record(i, await self._check_with_server(domain, servers[_get_tld(domain)]))
+
+        workers = [
+            worker(queue)
+            for queue in by_host.values()
+            for _ in range(min(self._max_concurrent_per_host, len(queue)))
+        ]
+        await asyncio.gather(*workers)
+
+    async def check_domains(
+        self,
+        domains: list[str],
+        group_key: Callable[[str], str] | None = None,
+    ) -> list[DomainResult]:
         """
         Check multiple domains in parallel with per-host rate limiting.
 
-        Domains are grouped by their RDAP server host, and each host has its
-        own concurrency limit and rate limiting.
+        Results are returned in the same order as domains. With group_key,
+        a group's remaining domains are skipped (left out of the results) as
+        soon as one of its domains is not available.
         """
         if not domains:
             return []
 
-        # Launch all checks concurrently - rate limiting is handled per-host
-        tasks = [self._check_single(domain) for domain in domains]
-        results = await asyncio.gather(*tasks)
-        return list(results)
+        results: list[DomainResult | None] = [None] * len(domains)
+        await self._check_grouped(domains, results.__setitem__, group_key)
+        if group_key:
+            return [r for r in results if r is not None]
+        return results
+
+    async def iter_check_domains(self, domains: list[str]) -> AsyncIterator[DomainResult]:
+        """
+        Check multiple domains, yielding each result as soon as it is ready.
+
+        Same checks as check_domains(), but results arrive in completion
+        order so callers can report fast hosts without waiting for slow ones.
+        """
+        if not domains:
+            return
+
+        queue: asyncio.Queue[DomainResult | None] = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                await self._check_grouped(domains, lambda _, r: queue.put_nowait(r))
+            finally:
+                queue.put_nowait(None)  # Done (or failed)
+
+        task = asyncio.create_task(produce())
+        try:
+            while (result := await queue.get()) is not None:
+                yield result
+            await task  # Re-raise anything that stopped the workers early
+        finally:
+            if not task.done():
+                task.cancel()
 
     async def check_domain(self, domain: str) -> DomainResult:
         """Check a single domain."""
@@ -337,19 +447,31 @@ async def check_domains_async(
     domains: list[str],
     timeout: float = 10.0,
     max_retries: int = 3,
+    group_key: Callable[[str], str] | None = None,
 ) -> list[DomainResult]:
     """
     Convenience function for checking domains without managing client lifecycle.
 
+    The underlying client is kept open between calls so pooled connections
+    (and per-host rate limit state) carry over from one batch to the next.
+    There is one client per event loop, closed when that loop shuts down.
+
     Args:
         domains: List of domain names to check
         timeout: Request timeout in seconds
         max_retries: Maximum number of retries per domain
+        group_key: Optional domain -> group function; see
+            AsyncRDAPClient.check_domains()
 
     Returns:
         List of DomainResult objects
     """
-    async with AsyncRDAPClient(
-        timeout=timeout, max_retries=max_retries
-    ) as client:
-        return await client.check_domains(domains)
+    client = loop_resources.get(
+        ("rdap", timeout, max_retries),
+        lambda: AsyncRDAPClient(timeout=timeout, max_retries=max_retries),
+        lambda c: c.__aexit__(None, None, None),
+    )
+    if client._client is None:
+        await client.__aenter__()
+
+    return await client.check_domains(domains, group_key)
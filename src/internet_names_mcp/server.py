@@ -3,24 +3,30 @@ Internet Names MCP Server
 
 An MCP server for checking availability of:
 - Domain names (via NameSilo API or RDAP)
-- Social media handles (via Sherlock + Playwright for X/Twitter)
+- Social media handles (via Sherlock's site rules + Playwright for X/Twitter)
 - Subreddit names (via Reddit API)
 """
 
 import asyncio
-import json
+import atexit
+import functools
 import logging
 import os
+import re
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Literal
 
 import httpx
-from mcp.server.fastmcp import FastMCP
 
-from .config import get_namesilo_key
+from . import jsonutil, lookup_cache, loop_resources
+from .config import get_cache_dir, get_namesilo_key
 
 # Suppress httpx request logging by default (shows API keys in URLs)
 # Set INTERNET_NAMES_DEBUG=1 to enable verbose HTTP logging
@@ -36,15 +42,43 @@ from .rdap_client import (
 # Server version
 VERSION = "0.1.8"
 
-# Initialize the MCP server
-mcp = FastMCP("internet-names")
-mcp._mcp_server.version = VERSION
+# Tool functions, registered on the FastMCP server when it is created
+_TOOLS = []
+_mcp = None
+
+
+def _tool(fn):
+    """Mark a function as an MCP tool."""
+    _TOOLS.append(fn)
+    return fn
+
+
+def _create_server():
+    """Build the FastMCP server and register every tool."""
+    from mcp.server.fastmcp import FastMCP
+
+    server = FastMCP("internet-names")
+    server._mcp_server.version = VERSION
+    for fn in _TOOLS:
+        server.tool()(fn)
+    return server
+
+
+def __getattr__(name: str):
+    """Create the MCP server on first access to `mcp` (PEP 562)."""
+    global _mcp
+    if name == "mcp":
+        if _mcp is None:
+            _mcp = _create_server()
+        return _mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # =============================================================================
 # Constants
 # =============================================================================
 
 NAMESILO_API_URL = "https://www.namesilo.com/api/checkRegisterAvailability"
+NAMESILO_BATCH_SIZE = 200  # Domains per NameSilo request (the API accepts up to 200)
 DEFAULT_TLDS = ["com", "io", "ai", "co", "app", "dev", "net", "org"]
 
 # Platforms supported by Sherlock + Twitter (via Playwright)
@@ -71,12 +105,43 @@ SHERLOCK_PLATFORM_MAP = {
     "threads": "threads",
 }
 
+# Reverse lookup: lowercased Sherlock site name -> our platform name
+PLATFORM_FROM_SHERLOCK = {site.lower(): platform for platform, site in SHERLOCK_PLATFORM_MAP.items()}
+
+# Maximum number of X.com profile pages open at once in one browser context
+TWITTER_MAX_CONCURRENT_PAGES = 5
+
+# Endpoint X's signup form uses to validate usernames. It is unofficial and
+# undocumented, so anything other than a clear answer falls back to the browser
+TWITTER_USERNAME_AVAILABLE_URL = "https://api.x.com/i/users/username_available.json"
+
+# Elements that decide an X.com result, and the subtree read when neither renders
+TWITTER_RESULT_SELECTOR = '[data-testid="empty_state_header_text"], [data-testid="UserName"]'
+TWITTER_FALLBACK_SELECTOR = '[data-testid="primaryColumn"]'
+
+# Resources the X.com check never looks at; aborted before they hit the network
+TWITTER_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+TWITTER_BLOCKED_URL_RE = re.compile(
+    r"^https?://([^/]+\.)?(googletagmanager\.com|google-analytics\.com"
+    r"|ads-twitter\.com|ads-api\.x\.com|analytics\.twitter\.com)/"
+)
+
+
+# Persistent HTTP clients, one per (purpose, event loop). The server runs a
+# single loop for its lifetime, so DNS, TCP and TLS setup are paid once per
+# host instead of once per tool call. Clients are closed with their loop.
+def _get_loop_client(name: str, factory: Callable[[], httpx.AsyncClient]) -> httpx.AsyncClient:
+    """Return the running loop's client called name, creating it with factory if needed."""
+    return loop_resources.get(
+        ("http", name), factory, httpx.AsyncClient.aclose, lambda c: c.is_closed
+    )
+
 
 # =============================================================================
 # Domain Checking (NameSilo + RDAP fallback)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DomainResult:
     """Result of a domain availability check."""
     domain: str
@@ -85,17 +150,105 @@ class DomainResult:
     error: str | None = None
 
 
+def _expand_domains(names: list[str], tlds: list[str]) -> Iterator[str]:
+    """
+    Yield domains for each name, skipping empty/whitespace names.
+
+    Names that already contain a dot are used as-is; bare names are paired
+    with every TLD.
+    """
+    suffixes = ["." + tld for tld in tlds]
+    for name in names:
+        name = name.strip()
+        if not name:
+            continue
+        if "." in name:
+            yield name
+        else:
+            yield from (name + suffix for suffix in suffixes)
+
+
+def _domain_basename(domain: str) -> str:
+    """Return the domain without its TLD, e.g. "foo.com" -> "foo"."""
+    return domain.rsplit(".", 1)[0]
+
+
+def _get_cached_domains(provider: str, domains: list[str]) -> tuple[list[DomainResult], list[str]]:
+    """Split domains into cached results and domains that still need a lookup."""
+    cached = lookup_cache.get_many(provider, domains)
+    hits = [DomainResult(**cached[d]) for d in domains if d in cached]
+    misses = [d for d in domains if d not in cached]
+    return hits, misses
+
+
+def _in_input_order(
+    domains: list[str],
+    results: list[DomainResult],
+    group_key: Callable[[str], str] | None = None,
+) -> list[DomainResult]:
+    """
+    Return results (cached and fresh, in any order) in the order of domains.
+
+    Domains are matched case-insensitively. A requested domain without a
+    result is reported as an error, unless group_key is given and its group
+    already has a non-available result (such domains are skipped on purpose).
+    """
+    by_domain = {r.domain.lower(): r for r in results}
+    failed = {group_key(r.domain.lower()) for r in results if not r.available} if group_key else set()
+
+    ordered = []
+    for domain in domains:
+        if (result := by_domain.get(domain.lower())) is not None:
+            ordered.append(result)
+        elif not group_key or group_key(domain.lower()) not in failed:
+            ordered.append(DomainResult(domain=domain, available=False, error="No result returned"))
+    return ordered
+
+
+def _cache_domain_results(provider: str, results: list[DomainResult]) -> None:
+    """
+    Cache definitive domain results (errors are always re-checked).
+
+    Available domains expire sooner than taken ones, since someone else may
+    register them at any time.
+    """
+    lookup_cache.put_many(
+        provider,
+        {r.domain: asdict(r) for r in results if not r.error and not r.available},
+        lookup_cache.DOMAIN_CACHE_TTL,
+    )
+    lookup_cache.put_many(
+        provider,
+        {r.domain: asdict(r) for r in results if not r.error and r.available},
+        lookup_cache.AVAILABLE_DOMAIN_CACHE_TTL,
+    )
+
+
 async def _check_domains_rdap_async(
     domains: list[str],
     max_retries: int = 3,
+    group_key: Callable[[str], str] | None = None,
 ) -> list[DomainResult]:
     """
     Check domain availability via RDAP protocol using async parallel execution.
 
     Returns DomainResult objects with proper status categorization.
     Errors (timeout, rate_limit) are NOT marked as unavailable.
+    Definitive results are served from / stored in the lookup cache.
+    With group_key, domains in a group that already has a non-available
+    result are skipped and left out of the returned list.
     """
-    rdap_results = await check_domains_async(domains, max_retries=max_retries)
+    requested = domains
+    cached, domains = _get_cached_domains("rdap", domains)
+    if group_key:
+        failed = {group_key(r.domain) for r in cached if not r.available}
+        domains = [d for d in domains if group_key(d) not in failed]
+    if not domains:
+        return cached
+
+    rdap_results = await check_domains_async(
+        domains, max_retries=max_retries, group_key=group_key
+    )
 
     # Convert rdap_client.DomainResult to local DomainResult for backward compatibility
     results = []
@@ -117,7 +270,38 @@ async def _check_domains_rdap_async(
                 error=r.error_message,
             ))
 
-    return results
+    _cache_domain_results("rdap", results)
+    return _in_input_order(requested, cached + results, group_key)
+
+
+# Event loop for synchronous callers, run on a daemon thread and started on
+# first use. Reusing it keeps the shared RDAP client's connection pool and
+# rate limit state alive between calls, which asyncio.run() would discard.
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread if needed."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="internet-names-loop", daemon=True
+            ).start()
+            atexit.register(_close_background_loop, loop)
+            _background_loop = loop
+        return _background_loop
+
+
+def _close_background_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Close the background loop's clients at exit (it never shuts down itself)."""
+    future = asyncio.run_coroutine_threadsafe(loop_resources.aclose_all(), loop)
+    try:
+        future.result(timeout=5)
+    except Exception:
+        pass
 
 
 def _check_domains_rdap(
@@ -128,14 +312,73 @@ def _check_domains_rdap(
     """
     Synchronous wrapper for RDAP domain checking.
 
+    Runs on a shared background event loop, so it also works when called
+    from code that is itself inside a running event loop.
+
     Note: The 'delay' parameter is deprecated and ignored.
     Rate limiting is now handled per-host automatically.
     """
-    return asyncio.run(_check_domains_rdap_async(domains, max_retries=max_retries))
+    future = asyncio.run_coroutine_threadsafe(
+        _check_domains_rdap_async(domains, max_retries=max_retries),
+        _get_background_loop(),
+    )
+    return future.result()
+
+
+# NameSilo reply sections: (key, available, error)
+NAMESILO_REPLY_SECTIONS = (
+    ("available", True, None),
+    ("unavailable", False, None),
+    ("invalid", False, "Invalid domain name"),
+)
+
+
+def _as_domain_list(section) -> list:
+    """
+    Normalize one section of a NameSilo reply to a list of entries.
+
+    The API returns different formats:
+    - Multiple: {"available": [{"domain": "foo.com", "price": 17.29}, ...]}
+    - Single: {"available": {"domain": {"domain": "foo.com", "price": 17.29}}}
+    - Single (unavailable/invalid): {"unavailable": {"domain": "foo.com"}}
+    """
+    if isinstance(section, dict):
+        # Single domain case - nested under "domain" key
+        section = section.get("domain")
+        if isinstance(section, (dict, str)):
+            return [section]
+    return section if isinstance(section, list) else []
 
 
-def _check_domains_internal(domains: list[str], api_key: str) -> list[DomainResult]:
-    """Internal function to check domain availability via NameSilo API."""
+def _parse_namesilo_reply(reply: dict) -> list[DomainResult]:
+    """Convert a NameSilo checkRegisterAvailability reply into DomainResults."""
+    results = []
+
+    for key, available, error in NAMESILO_REPLY_SECTIONS:
+        for item in _as_domain_list(reply.get(key)):
+            if isinstance(item, dict):
+                domain = item.get("domain", "")
+                price = item.get("price") if available else None
+            elif isinstance(item, str):
+                domain, price = item, None
+            else:
+                continue
+            results.append(DomainResult(
+                domain=domain,
+                available=available,
+                price=float(price) if price else None,
+                error=error,
+            ))
+
+    return results
+
+
+async def _check_namesilo_chunk(
+    client: httpx.AsyncClient,
+    domains: list[str],
+    api_key: str,
+) -> list[DomainResult]:
+    """Check one batch of domains with a single NameSilo API request."""
     params = {
         "version": "1",
         "type": "json",
@@ -144,9 +387,9 @@ def _check_domains_internal(domains: list[str], api_key: str) -> list[DomainResu
     }
 
     try:
-        response = httpx.get(NAMESILO_API_URL, params=params, timeout=30)
+        response = await client.get(NAMESILO_API_URL, params=params)
         response.raise_for_status()
-        data = response.json()
+        data = jsonutil.loads(response.content)
     except httpx.HTTPError as e:
         return [DomainResult(domain=d, available=False, error=str(e)) for d in domains]
     except ValueError as e:
@@ -158,70 +401,217 @@ def _check_domains_internal(domains: list[str], api_key: str) -> list[DomainResu
         detail = reply.get("detail", "Unknown error")
         return [DomainResult(domain=d, available=False, error=f"API Error {code}: {detail}") for d in domains]
 
-    results = []
+    return _parse_namesilo_reply(reply)
 
-    # Process available domains
-    # API returns different formats:
-    # - Multiple: {"available": [{"domain": "foo.com", "price": 17.29}, ...]}
-    # - Single: {"available": {"domain": {"domain": "foo.com", "price": 17.29}}}
-    available = reply.get("available", {})
-    if isinstance(available, dict):
-        # Single domain case - nested under "domain" key
-        inner = available.get("domain")
-        if isinstance(inner, dict):
-            available = [inner]
-        elif isinstance(inner, list):
-            available = inner
-        else:
-            available = []
-    elif not isinstance(available, list):
-        available = []
-
-    for item in available:
-        if isinstance(item, dict):
-            domain = item.get("domain", "")
-            price = item.get("price")
-            results.append(DomainResult(
-                domain=domain,
-                available=True,
-                price=float(price) if price else None
-            ))
 
-    # Process unavailable domains
-    unavailable = reply.get("unavailable", {})
-    if isinstance(unavailable, dict) and "domain" in unavailable:
-        unavailable = [unavailable["domain"]]
-    elif not isinstance(unavailable, list):
-        unavailable = []
-
-    for domain in unavailable:
-        if isinstance(domain, str):
-            results.append(DomainResult(domain=domain, available=False))
-        elif isinstance(domain, dict):
-            results.append(DomainResult(domain=domain.get("domain", ""), available=False))
-
-    # Process invalid domains
-    invalid = reply.get("invalid", {})
-    if isinstance(invalid, dict) and "domain" in invalid:
-        invalid = [invalid["domain"]]
-    elif not isinstance(invalid, list):
-        invalid = []
-
-    for domain in invalid:
-        if isinstance(domain, str):
-            results.append(DomainResult(domain=domain, available=False, error="Invalid domain name"))
-        elif isinstance(domain, dict):
-            results.append(DomainResult(domain=domain.get("domain", ""), available=False, error="Invalid domain name"))
+def _get_namesilo_client() -> httpx.AsyncClient:
+    """Return the persistent NameSilo client for the running event loop."""
+    return _get_loop_client("namesilo", lambda: httpx.AsyncClient(
+        http2=True,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=4),
+    ))
 
-    return results
+
+async def _check_domains_internal(domains: list[str], api_key: str) -> list[DomainResult]:
+    """
+    Internal function to check domain availability via NameSilo API.
+
+    Domains are split into batches of NAMESILO_BATCH_SIZE and the batches are
+    requested concurrently, so wall time tracks the slowest batch rather than
+    the sum of all of them. Definitive results are served from / stored in
+    the lookup cache.
+    """
+    requested = domains
+    cached, domains = _get_cached_domains("namesilo", domains)
+    if not domains:
+        return cached
+
+    chunks = [
+        domains[i:i + NAMESILO_BATCH_SIZE]
+        for i in range(0, len(domains), NAMESILO_BATCH_SIZE)
+    ]
+
+    client = _get_namesilo_client()
+    chunk_results = await asyncio.gather(
+        *(_check_namesilo_chunk(client, chunk, api_key) for chunk in chunks)
+    )
+
+    results = [r for chunk in chunk_results for r in chunk]
+    _cache_domain_results("namesilo", results)
+    return _in_input_order(requested, cached + results)
 
 
 # =============================================================================
-# Social Media Handle Checking (Sherlock + Playwright for Twitter)
+# Social Media Handle Checking (Sherlock site rules + Playwright for Twitter)
 # =============================================================================
 
+# Set INTERNET_NAMES_SHERLOCK_CLI=1 to check handles by running the sherlock
+# CLI in a subprocess instead of probing the sites directly
+USE_SHERLOCK_CLI = bool(os.environ.get("INTERNET_NAMES_SHERLOCK_CLI"))
+
+# How many usernames check_everything checks at once (each may be a
+# sherlock subprocess when USE_SHERLOCK_CLI is set)
+HANDLE_CHECK_CONCURRENCY = 4
+
+# Request settings mirrored from Sherlock's own probes
+HANDLE_PROBE_TIMEOUT = 15
+HANDLE_PROBE_USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64; rv:129.0) Gecko/20100101 Firefox/129.0"
+
+# Fingerprints of bot-detection pages (from Sherlock); a hit means "unknown"
+HANDLE_PROBE_WAF_MARKERS = (
+    '<span id="challenge-error-text">',  # Cloudflare
+    "AwsWafIntegration.forceRefreshToken",  # Cloudfront (AWS)
+    '{return l.onPageView}}),Object.defineProperty(r,"perimeterxIdentifiers",{enumerable:',  # PerimeterX
+)
+
+# One result line of sherlock CLI output, e.g. "[+] GitHub: https://..." or
+# "[-] Reddit: Not Found!"
+SHERLOCK_LINE_RE = re.compile(r"^\[([+-])\] ([^:\n]+?)(?:: (.*))?$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_sherlock_sites() -> dict[str, dict] | None:
+    """
+    Load Sherlock's bundled site manifest for the platforms we support.
+
+    Returns a mapping of our platform name -> Sherlock site entry, or None
+    if the manifest can't be read (callers then fall back to the sherlock CLI).
+    """
+    try:
+        from importlib.resources import files
+        manifest = files("sherlock_project").joinpath("resources", "data.json")
+        data = jsonutil.loads(manifest.read_text(encoding="utf-8"))
+    except (ImportError, OSError, ValueError):
+        return None
+
+    return {
+        platform: data[site_name]
+        for platform, site_name in SHERLOCK_PLATFORM_MAP.items()
+        if site_name in data
+    }
+
+
+def _classify_probe_response(site: dict, response: httpx.Response) -> bool:
+    """Return True if the response shows the username is available (Sherlock rules)."""
+    error_types = site["errorType"]
+    if isinstance(error_types, str):
+        error_types = [error_types]
+
+    available = False
+
+    if "message" in error_types:
+        errors = site.get("errorMsg")
+        if isinstance(errors, str):
+            errors = [errors]
+        available = any(error in response.text for error in errors or [])
+
+    if "status_code" in error_types and not available:
+        error_codes = site.get("errorCode")
+        if isinstance(error_codes, int):
+            error_codes = [error_codes]
+        if error_codes is not None and response.status_code in error_codes:
+            available = True
+        elif response.status_code >= 300 or response.status_code < 200:
+            available = True
+
+    if "response_url" in error_types and not available:
+        available = not (200 <= response.status_code < 300)
+
+    return available
+
+
+async def _probe_platform(client: httpx.AsyncClient, site: dict, username: str) -> dict:
+    """Check one platform for a username with a direct HTTP request."""
+    url = site["url"].replace("{}", username.replace(" ", "%20"))
+
+    regex_check = site.get("regexCheck")
+    if regex_check and re.search(regex_check, username) is None:
+        return {"available": None, "error": "Illegal Username Format For This Site!"}
+
+    error_types = site["errorType"]
+    if isinstance(error_types, str):
+        error_types = [error_types]
+    if any(t not in ("message", "status_code", "response_url") for t in error_types):
+        return {"available": None, "error": f"Unknown error type '{site['errorType']}'"}
+
+    probe_url = site.get("urlProbe", site["url"]).replace("{}", username)
+
+    # Like Sherlock: HEAD is enough for status-code checks, otherwise GET the page
+    method = site.get("request_method")
+    if method is None:
+        method = "HEAD" if site["errorType"] == "status_code" else "GET"
+
+    headers = {"User-Agent": HANDLE_PROBE_USER_AGENT}
+    headers.update(site.get("headers", {}))
+
+    try:
+        response = await client.request(
+            method,
+            probe_url,
+            headers=headers,
+            # response_url sites redirect when the user doesn't exist
+            follow_redirects="response_url" not in error_types,
+        )
+    except httpx.TimeoutException:
+        return {"available": None, "error": "Timeout Error"}
+    except httpx.HTTPError as e:
+        return {"available": None, "error": f"Error Connecting: {str(e)[:80]}"}
+
+    if any(marker in response.text for marker in HANDLE_PROBE_WAF_MARKERS):
+        return {"available": None, "error": "Blocked by bot detection"}
+
+    if _classify_probe_response(site, response):
+        return {"available": True}
+    return {"available": False, "url": url}
+
+
+def _get_handle_probe_client() -> httpx.AsyncClient:
+    """Return the persistent client for handle probes (Sherlock sites and X)."""
+    return _get_loop_client("handle-probe", lambda: httpx.AsyncClient(
+        headers={"User-Agent": HANDLE_PROBE_USER_AGENT},
+        timeout=HANDLE_PROBE_TIMEOUT,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    ))
+
+
+async def _check_platforms_direct(
+    username: str,
+    platforms: list[str],
+    sites: dict[str, dict],
+) -> dict[str, dict]:
+    """Check username on the given platforms with concurrent direct HTTP probes."""
+    platforms = [p for p in platforms if p in sites]
+    if not platforms:
+        return {}
+
+    client = _get_handle_probe_client()
+    results = await asyncio.gather(
+        *(_probe_platform(client, sites[p], username) for p in platforms)
+    )
+    return dict(zip(platforms, results))
+
+
+def _record_sherlock_line(match: re.Match, results: dict[str, dict]) -> None:
+    """Store the result from one SHERLOCK_LINE_RE match under our platform name."""
+    sign, site, status = match.groups()
+    platform = PLATFORM_FROM_SHERLOCK.get(site.strip().lower())
+    if platform is None:
+        return
+    status = (status or "").strip()
+
+    if sign == "+":
+        results[platform] = {"available": False, "url": status or None}
+    elif not status:
+        return
+    elif "Error" in status or "Illegal" in status:
+        results[platform] = {"available": None, "error": status}
+    else:
+        results[platform] = {"available": True}
+
+
 def _check_sherlock(username: str, platforms: list[str]) -> dict[str, dict]:
-    """Check username via Sherlock (excludes Twitter which is handled separately)."""
+    """Check username via the Sherlock CLI (excludes Twitter which is handled separately)."""
     # Filter out twitter - we handle that with Playwright
     sherlock_platforms = [SHERLOCK_PLATFORM_MAP[p] for p in platforms if p in SHERLOCK_PLATFORM_MAP]
 
@@ -235,39 +625,43 @@ def _check_sherlock(username: str, platforms: list[str]) -> dict[str, dict]:
     for p in sherlock_platforms:
         cmd.extend(["--site", p])
 
+    wanted = {p for p in platforms if p in SHERLOCK_PLATFORM_MAP}
+    results = {}
+
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=90)
-        output = result.stdout + result.stderr
-    except subprocess.TimeoutExpired:
-        return {p.lower(): {"available": None, "error": "Timeout"} for p in sherlock_platforms}
+        # Results are printed on stdout; stderr only carries progress/update noise
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1
+        )
     except FileNotFoundError:
-        return {p.lower(): {"available": None, "error": "sherlock not found"} for p in sherlock_platforms}
+        return {p: {"available": None, "error": "sherlock not found"} for p in wanted}
 
-    results = {}
+    # Kill sherlock if it runs too long; whatever it reported so far is kept
+    timed_out = threading.Event()
 
-    for line in output.split("\n"):
-        line = line.strip()
-        if not line or line.startswith("[*]"):
-            continue
+    def kill_on_timeout():
+        timed_out.set()
+        proc.kill()
 
-        if line.startswith("[+]"):
-            parts = line[4:].split(": ", 1)
-            if len(parts) >= 1:
-                platform = parts[0].lower()
-                url = parts[1] if len(parts) > 1 else None
-                results[platform] = {"available": False, "url": url}
-
-        elif line.startswith("[-]"):
-            parts = line[4:].split(": ", 1)
-            if len(parts) == 2:
-                platform = parts[0].lower()
-                status = parts[1]
-                if status == "Not Found!":
-                    results[platform] = {"available": True}
-                elif "Error" in status or "Illegal" in status:
-                    results[platform] = {"available": None, "error": status}
-                else:
-                    results[platform] = {"available": True}
+    timer = threading.Timer(90, kill_on_timeout)
+    timer.start()
+    try:
+        # Parse results as they stream in and stop once every site is reported
+        for line in proc.stdout:
+            if match := SHERLOCK_LINE_RE.match(line.rstrip()):
+                _record_sherlock_line(match, results)
+                if wanted <= results.keys():
+                    break
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.terminate()
+        proc.stdout.close()
+        proc.wait()
+
+    if timed_out.is_set():
+        for p in wanted - results.keys():
+            results[p] = {"available": None, "error": "Timeout"}
 
     return results
 
@@ -296,50 +690,259 @@ async def _install_chromium() -> tuple[bool, str]:
         return False, f"Installation error: {str(e)[:100]}"
 
 
-async def _check_twitter(username: str, _retry: bool = True) -> dict:
-    """Check Twitter/X username using Playwright (async)."""
+async def _block_twitter_resource(route) -> None:
+    """Playwright route handler that drops resources the X.com check doesn't need."""
+    request = route.request
+    if (
+        request.resource_type in TWITTER_BLOCKED_RESOURCE_TYPES
+        or TWITTER_BLOCKED_URL_RE.match(request.url)
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _check_twitter_page(page, username: str) -> dict:
+    """Check a single Twitter/X username using an already-open Playwright page."""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    url = f"https://x.com/{username}"
+    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+    # Wait until X renders one of the elements that decides the result,
+    # rather than sleeping for a fixed time
     try:
-        from playwright.async_api import async_playwright
-    except ImportError:
-        return {"available": None, "error": "playwright not installed. Run: pip install playwright"}
+        await page.wait_for_selector(TWITTER_RESULT_SELECTOR, timeout=8000)
+    except PlaywrightTimeoutError:
+        pass  # Fall through to the text fallback below
+
+    empty_state = await page.query_selector('[data-testid="empty_state_header_text"]')
+
+    if empty_state:
+        text = (await empty_state.inner_text()).replace("\u2019", "'").lower()
+        if "doesn't exist" in text:
+            return {"available": True}
+        elif "suspended" in text:
+            return {"available": False, "url": url, "note": "suspended"}
 
+    user_name = await page.query_selector('[data-testid="UserName"]')
+    if user_name:
+        return {"available": False, "url": url}
+
+    # Read only the main column rather than serializing the whole page
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            )
-            page = await context.new_page()
+        text = await page.locator(TWITTER_FALLBACK_SELECTOR).first.inner_text(timeout=2000)
+    except PlaywrightTimeoutError:
+        text = ""
+    text = text.replace("\u2019", "'")
+
+    if "This account doesn't exist" in text:
+        return {"available": True}
+    elif f"@{username.lower()}" in text.lower():
+        return {"available": False, "url": url}
+    else:
+        return {"available": None, "error": "Could not determine"}
+
 
-            url = f"https://x.com/{username}"
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(3000)
+async def _probe_twitter_username(client: httpx.AsyncClient, username: str) -> dict | None:
+    """
+    Ask X's signup username check whether a handle is free.
+
+    Returns a result dict, or None if the answer is ambiguous (blocked,
+    rate limited, unexpected payload) and the browser check should run.
+    """
+    try:
+        response = await client.get(TWITTER_USERNAME_AVAILABLE_URL, params={"username": username})
+        if response.status_code != 200:
+            return None
+        data = jsonutil.loads(response.content)
+    except (httpx.HTTPError, ValueError):
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    if data.get("valid") is True:
+        return {"available": True}
+    if data.get("reason") == "taken":
+        return {"available": False, "url": f"https://x.com/{username}"}
+    return None
+
+
+def _get_twitter_profile_dir() -> Path:
+    """Get the Chromium profile directory used for X.com checks."""
+    profile_dir = get_cache_dir() / 'chromium'
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    return profile_dir
+
+
+class _TwitterBrowser:
+    """
+    Long-lived Chromium context with a pool of warm pages for X.com checks.
+
+    The context uses a persistent profile so cookies and the HTTP cache
+    survive across checks (and server restarts). If the profile is locked by
+    another server process, a throwaway context is used instead.
+    """
 
-            empty_state = await page.query_selector('[data-testid="empty_state_header_text"]')
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None  # Only set for the throwaway-context fallback
+        self._context = None
+        self._pages: asyncio.Queue | None = None
 
-            if empty_state:
-                text = (await empty_state.inner_text()).replace("\u2019", "'").lower()
-                if "doesn't exist" in text:
-                    await browser.close()
-                    return {"available": True}
-                elif "suspended" in text:
+    async def start(self) -> None:
+        """Launch the browser and open the page pool (no-op if running)."""
+        async with self._lock:
+            if self._context is not None:
+                return
+
+            from playwright.async_api import async_playwright
+
+            if self._playwright is not None:
+                # Previous browser crashed; shut it and its driver down first
+                await self._stop()
+
+            user_agent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+            playwright = await async_playwright().start()
+            browser = None
+            try:
+                try:
+                    context = await playwright.chromium.launch_persistent_context(
+                        str(_get_twitter_profile_dir()),
+                        headless=True,
+                        user_agent=user_agent,
+                    )
+                except Exception as e:
+                    if "Executable doesn't exist" in str(e):
+                        raise
+                    # Profile in use by another process (or unusable)
+                    browser = await playwright.chromium.launch(headless=True)
+                    context = await browser.new_context(user_agent=user_agent)
+
+                await context.route("**/*", _block_twitter_resource)
+                pages = asyncio.Queue()
+                for _ in range(TWITTER_MAX_CONCURRENT_PAGES):
+                    pages.put_nowait(await context.new_page())
+            except BaseException:
+                if browser is not None:
                     await browser.close()
-                    return {"available": False, "url": url, "note": "suspended"}
+                await playwright.stop()
+                raise
+
+            context.on("close", lambda _: self._forget())
+            self._playwright = playwright
+            self._browser = browser
+            self._context = context
+            self._pages = pages
+
+    def _forget(self) -> None:
+        """Drop references after the browser closed or crashed."""
+        self._context = None
+        self._pages = None
+
+    async def _stop(self) -> None:
+        """Close the context, the fallback browser and Playwright, ignoring errors."""
+        context, browser, playwright = self._context, self._browser, self._playwright
+        self._forget()
+        self._browser = self._playwright = None
+        # At loop shutdown Playwright's connection task may already be
+        # cancelled, so closes that need a driver reply get a time limit.
+        # Stopping Playwright ends the driver, which takes Chromium with it.
+        for owner in (context, browser):
+            if owner is not None:
+                try:
+                    await asyncio.wait_for(owner.close(), 5)
+                except Exception:
+                    pass
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+
+    async def close(self) -> None:
+        """Close the browser and stop Playwright."""
+        async with self._lock:
+            await self._stop()
+
+    async def check(self, username: str) -> dict:
+        """Check one username on a pooled page (waits for a free page)."""
+        try:
+            if self._pages is None:
+                await self.start()  # Relaunch after a crash
+            pages = self._pages
+            page = await pages.get()
+        except Exception as e:
+            return {"available": None, "error": str(e)[:100]}
+        try:
+            return await _check_twitter_page(page, username)
+        except Exception as e:
+            return {"available": None, "error": str(e)[:100]}
+        finally:
+            if page.is_closed() and self._context is not None:
+                try:
+                    page = await self._context.new_page()
+                except Exception:
+                    pass
+            pages.put_nowait(page)
+
+
+def _get_twitter_browser() -> _TwitterBrowser:
+    """Return the shared browser for the running event loop (closed with the loop)."""
+    return loop_resources.get("twitter-browser", _TwitterBrowser, _TwitterBrowser.close)
+
+
+async def _check_twitter_many(usernames: list[str]) -> dict[str, dict]:
+    """
+    Check several Twitter/X usernames, reusing recent cached results.
 
-            user_name = await page.query_selector('[data-testid="UserName"]')
-            if user_name:
-                await browser.close()
-                return {"available": False, "url": url}
+    Successful results are cached for lookup_cache.HANDLE_CACHE_TTL seconds;
+    errors are not cached so they are retried on the next call.
+    """
+    cached = lookup_cache.get_many("twitter", usernames)
+    missing = [u for u in usernames if u not in cached]
+    if not missing:
+        return cached
 
-            body_text = (await page.inner_text("body")).replace("\u2019", "'")
-            await browser.close()
+    results = await _run_twitter_checks(missing)
+    lookup_cache.put_many(
+        "twitter",
+        {u: r for u, r in results.items() if not r.get("error")},
+        lookup_cache.HANDLE_CACHE_TTL,
+    )
+    return cached | results
 
-            if "This account doesn't exist" in body_text:
-                return {"available": True}
-            elif f"@{username.lower()}" in body_text.lower():
-                return {"available": False, "url": url}
-            else:
-                return {"available": None, "error": "Could not determine"}
+
+async def _run_twitter_checks(usernames: list[str], _retry: bool = True) -> dict[str, dict]:
+    """
+    Check several Twitter/X usernames using Playwright (async).
+
+    Usernames are first probed over plain HTTPS; only those the probe can't
+    settle are loaded in a shared, long-lived browser (Chromium starts once
+    per server process) on a pool of warm pages (at most
+    TWITTER_MAX_CONCURRENT_PAGES at a time).
+    """
+    results = {}
+    if _retry:  # The retry pass only gets usernames that were already probed
+        client = _get_handle_probe_client()
+        probes = await asyncio.gather(*(_probe_twitter_username(client, u) for u in usernames))
+        results = {u: r for u, r in zip(usernames, probes) if r is not None}
+        usernames = [u for u in usernames if u not in results]
+        if not usernames:
+            return results
+
+    try:
+        import playwright.async_api  # noqa: F401
+    except ImportError:
+        error = {"available": None, "error": "playwright not installed. Run: pip install playwright"}
+        return results | {u: dict(error) for u in usernames}
+
+    browser = _get_twitter_browser()
+    try:
+        await browser.start()
+        checked = await asyncio.gather(*(browser.check(u) for u in usernames))
+        return results | dict(zip(usernames, checked))
 
     except Exception as e:
         error_str = str(e)
@@ -348,25 +951,64 @@ async def _check_twitter(username: str, _retry: bool = True) -> dict:
                 # Auto-install chromium and retry once
                 success, msg = await _install_chromium()
                 if success:
-                    return await _check_twitter(username, _retry=False)
+                    return results | await _run_twitter_checks(usernames, _retry=False)
                 else:
-                    return {"available": None, "error": f"Chromium auto-install failed: {msg}"}
+                    error = {"available": None, "error": f"Chromium auto-install failed: {msg}"}
             else:
-                return {"available": None, "error": "Chromium not installed. Run: playwright install chromium"}
-        return {"available": None, "error": error_str[:100]}
+                error = {"available": None, "error": "Chromium not installed. Run: playwright install chromium"}
+        else:
+            error = {"available": None, "error": error_str[:100]}
+        return results | {u: dict(error) for u in usernames}
 
 
-async def _check_handles_internal(username: str, platforms: list[str]) -> dict[str, dict]:
-    """Check username across multiple platforms."""
-    results = {}
+async def _check_twitter(username: str) -> dict:
+    """Check Twitter/X username using Playwright (async)."""
+    results = await _check_twitter_many([username])
+    return results[username]
+
+
+async def _check_handles_internal(
+    username: str,
+    platforms: list[str],
+    twitter_result: dict | None = None,
+) -> dict[str, dict]:
+    """
+    Check username across multiple platforms.
 
-    # Check non-Twitter platforms via Sherlock
-    sherlock_results = _check_sherlock(username, [p for p in platforms if p != "twitter"])
-    results.update(sherlock_results)
+    If twitter_result is given (e.g. from a batched _check_twitter_many call),
+    it is used instead of launching a browser for this username. Results
+    are cached per platform like _check_twitter_many's. Twitter and the
+    other platforms are checked concurrently.
+    """
+    # Start Twitter (Playwright) first so it overlaps the other platforms
+    twitter_task = None
+    if "twitter" in platforms and twitter_result is None:
+        twitter_task = asyncio.create_task(_check_twitter(username))
+
+    # Check non-Twitter platforms using Sherlock's site rules
+    other_platforms = [p for p in platforms if p != "twitter"]
+    cached = lookup_cache.get_many("handle", [f"{p}:{username}" for p in other_platforms])
+    results = {p: cached[f"{p}:{username}"] for p in other_platforms if f"{p}:{username}" in cached}
+    to_check = [p for p in other_platforms if p not in results]
+
+    if to_check:
+        sites = None if USE_SHERLOCK_CLI else _load_sherlock_sites()
+        if sites is None:
+            # The CLI path blocks on a subprocess; keep the event loop free
+            fresh = await asyncio.to_thread(_check_sherlock, username, to_check)
+        else:
+            fresh = await _check_platforms_direct(username, to_check, sites)
+        results.update(fresh)
+        lookup_cache.put_many(
+            "handle",
+            {f"{p}:{username}": r for p, r in fresh.items() if not r.get("error")},
+            lookup_cache.HANDLE_CACHE_TTL,
+        )
 
-    # Check Twitter via Playwright if requested
+    if twitter_task is not None:
+        twitter_result = await twitter_task
     if "twitter" in platforms:
-        results["twitter"] = await _check_twitter(username)
+        results["twitter"] = twitter_result
 
     # Fill in missing platforms
     for p in platforms:
@@ -380,58 +1022,256 @@ async def _check_handles_internal(username: str, platforms: list[str]) -> dict[s
 # Subreddit Checking (Reddit API)
 # =============================================================================
 
-def _check_subreddits_internal(names: list[str]) -> list[dict]:
-    """Check subreddit availability via Reddit JSON API."""
-    results = []
-    headers = {"User-Agent": "SubredditChecker/1.0"}
+# Token bucket for Reddit requests: bursts of up to SUBREDDIT_BURST requests
+# go out at once, after which requests are paced at SUBREDDIT_RATE per second
+SUBREDDIT_BURST = 10
+SUBREDDIT_RATE = 2.0
 
-    with httpx.Client(headers=headers, timeout=10) as client:
-        for name in names:
-            name = name.lower().strip()
-            if name.startswith("r/"):
-                name = name[2:]
+# Reddit's batch lookup endpoint and how many names it accepts per request
+SUBREDDIT_INFO_URL = "https://www.reddit.com/api/info.json"
+SUBREDDIT_INFO_BATCH_SIZE = 100
 
-            # Skip empty names
-            if not name:
-                continue
+# Retries for rate-limited (429) or server-error (5xx) Reddit responses,
+# backing off SUBREDDIT_RETRY_BACKOFF * 2**attempt seconds between tries
+SUBREDDIT_MAX_RETRIES = 2
+SUBREDDIT_RETRY_BACKOFF = 1.0
 
-            url = f"https://www.reddit.com/r/{name}/about.json"
 
-            try:
-                response = client.get(url, follow_redirects=True)
-
-                if response.status_code == 404:
-                    results.append({"name": name, "available": True})
-                elif response.status_code == 403:
-                    results.append({"name": name, "available": False, "note": "private"})
-                elif response.status_code == 200:
-                    data = response.json()
-                    sub_data = data.get("data", {})
-                    if sub_data.get("display_name"):
-                        subscribers = sub_data.get("subscribers", 0)
-                        results.append({
-                            "name": name,
-                            "available": False,
-                            "subscribers": subscribers
-                        })
-                    else:
-                        results.append({"name": name, "available": True})
-                else:
-                    results.append({"name": name, "available": None, "error": f"HTTP {response.status_code}"})
+class _TokenBucket:
+    """
+    Async token bucket shared by all subreddit checks.
+
+    Tokens may go negative: each caller reserves a token immediately and then
+    sleeps off its share of the debt, so no lock is needed and the bucket
+    works across event loops.
+    """
 
-            except Exception as e:
-                results.append({"name": name, "available": None, "error": str(e)[:100]})
+    def __init__(self, capacity: int, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
 
-            time.sleep(0.5)  # Rate limiting
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
 
-    return results
+    async def acquire(self) -> None:
+        self._refill()
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for at least `seconds` from now."""
+        self._refill()
+        # The next acquire() spends one token, leaving it exactly `seconds` of debt
+        self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+
+_subreddit_bucket = _TokenBucket(SUBREDDIT_BURST, SUBREDDIT_RATE)
+
+
+def _observe_reddit_rate_limit(response: httpx.Response) -> None:
+    """Pause the bucket until the window resets once Reddit says we're out."""
+    try:
+        remaining = float(response.headers["x-ratelimit-remaining"])
+        reset = float(response.headers["x-ratelimit-reset"])
+    except (KeyError, ValueError):
+        return
+    if remaining < 1:
+        _subreddit_bucket.pause(reset)
+
+
+# How long an idle Reddit connection is kept open for the next batch
+SUBREDDIT_KEEPALIVE_EXPIRY = 300
+
+
+def _get_subreddit_client() -> httpx.AsyncClient:
+    """Return the persistent Reddit client for the running event loop."""
+    return _get_loop_client("reddit", lambda: httpx.AsyncClient(
+        http2=True,
+        headers={"User-Agent": "SubredditChecker/1.0"},
+        timeout=10,
+        limits=httpx.Limits(
+            max_connections=10,
+            max_keepalive_connections=10,
+            keepalive_expiry=SUBREDDIT_KEEPALIVE_EXPIRY,
+        ),
+    ))
+
+
+def _normalize_subreddit_name(name: str) -> str:
+    """Lowercase a subreddit name and strip any leading r/ prefix."""
+    name = name.lower().strip()
+    if name.startswith("r/"):
+        name = name[2:]
+    return name
+
+
+async def _check_subreddit(client: httpx.AsyncClient, name: str, with_metadata: bool = True) -> dict:
+    """
+    Check a single subreddit via Reddit's about.json endpoint.
+
+    Without with_metadata, a HEAD request settles missing and private
+    subreddits without downloading the JSON body. Anything else goes through
+    one GET, whose body decides whether the subreddit really exists (a 200
+    without a display_name means it is available). With with_metadata the
+    GET is needed anyway, so the HEAD is skipped.
+    """
+    url = f"https://www.reddit.com/r/{name}/about.json"
+
+    try:
+        if not with_metadata:
+            head = await client.head(url)
+            _observe_reddit_rate_limit(head)
+            if head.status_code == 404:
+                return {"name": name, "available": True}
+            elif head.status_code == 403:
+                return {"name": name, "available": False, "note": "private"}
+            elif head.status_code != 200 and not head.is_redirect:
+                return {"name": name, "available": None, "error": f"HTTP {head.status_code}"}
+
+        response = await client.get(url, follow_redirects=True)
+        _observe_reddit_rate_limit(response)
+
+        if response.status_code == 404:
+            return {"name": name, "available": True}
+        elif response.status_code == 403:
+            return {"name": name, "available": False, "note": "private"}
+        elif response.status_code == 200:
+            data = jsonutil.loads(response.content)
+            sub_data = data.get("data", {})
+            if sub_data.get("display_name"):
+                subscribers = sub_data.get("subscribers", 0)
+                return {
+                    "name": name,
+                    "available": False,
+                    "subscribers": subscribers
+                }
+            else:
+                return {"name": name, "available": True}
+        else:
+            return {"name": name, "available": None, "error": f"HTTP {response.status_code}"}
+
+    except Exception as e:
+        return {"name": name, "available": None, "error": str(e)[:100]}
+
+
+async def _lookup_subreddit_batch(
+    client: httpx.AsyncClient, names: list[str], with_metadata: bool = True
+) -> dict[str, dict]:
+    """
+    Look up several subreddits with one request to Reddit's /api/info.json.
+
+    Returns results only for the names Reddit reports as existing. Names
+    missing from the reply (or every name, if the request fails) still need
+    an individual _check_subreddit call, since banned and some private
+    subreddits are left out of the listing.
+    """
+    try:
+        response = await client.get(SUBREDDIT_INFO_URL, params={"sr_name": ",".join(names)})
+        _observe_reddit_rate_limit(response)
+        if response.status_code != 200:
+            return {}
+        data = jsonutil.loads(response.content)
+    except (httpx.HTTPError, ValueError):
+        return {}
+
+    wanted = set(names)
+    found = {}
+    for child in data.get("data", {}).get("children", []):
+        sub_data = child.get("data", {})
+        name = sub_data.get("display_name", "").lower()
+        if name not in wanted:
+            continue
+        if sub_data.get("subreddit_type") == "private":
+            found[name] = {"name": name, "available": False, "note": "private"}
+        elif with_metadata:
+            found[name] = {
+                "name": name,
+                "available": False,
+                "subscribers": sub_data.get("subscribers", 0),
+            }
+        else:
+            found[name] = {"name": name, "available": False}
+    return found
+
+
+async def _check_subreddits_internal(names: list[str], with_metadata: bool = True) -> list[dict]:
+    """
+    Check subreddit availability via Reddit JSON API.
+
+    Existing subreddits are found in batches of SUBREDDIT_INFO_BATCH_SIZE via
+    /api/info.json; the remaining names are checked one by one. Requests run
+    concurrently, paced by a shared token bucket so small batches go out in
+    a single burst while larger ones stay polite to Reddit.
+    Set with_metadata=False when subscriber counts aren't needed.
+    """
+    # Normalize and skip empty names
+    names = [n for n in (_normalize_subreddit_name(name) for name in names) if n]
+    if not names:
+        return []
+
+    # Results without subscriber counts are cached separately
+    cache_kind = "subreddit" if with_metadata else "subreddit-basic"
+    requested = names
+    cached = lookup_cache.get_many(cache_kind, names)
+    names = [n for n in names if n not in cached]
+    if not names:
+        return [cached[n] for n in requested]
+
+    # One HTTP/2 connection multiplexes every request instead of paying a
+    # TLS handshake per subreddit
+    client = _get_subreddit_client()
+
+    async def paced_check(name: str) -> dict:
+        for attempt in range(SUBREDDIT_MAX_RETRIES + 1):
+            await _subreddit_bucket.acquire()
+            result = await _check_subreddit(client, name, with_metadata)
+            error = result.get("error", "")
+            if error != "HTTP 429" and not error.startswith("HTTP 5"):
+                break
+            if attempt < SUBREDDIT_MAX_RETRIES:
+                await asyncio.sleep(SUBREDDIT_RETRY_BACKOFF * 2 ** attempt)
+        return result
+
+    async def paced_batch(batch: list[str]) -> dict[str, dict]:
+        await _subreddit_bucket.acquire()
+        return await _lookup_subreddit_batch(client, batch, with_metadata)
+
+    found: dict[str, dict] = {}
+    for batch_found in await asyncio.gather(*(
+        paced_batch(names[i:i + SUBREDDIT_INFO_BATCH_SIZE])
+        for i in range(0, len(names), SUBREDDIT_INFO_BATCH_SIZE)
+    )):
+        found.update(batch_found)
+
+    remaining = [n for n in names if n not in found]
+    checked = dict(zip(remaining, await asyncio.gather(*(paced_check(n) for n in remaining))))
+    results = [found.get(n) or checked[n] for n in names]
+
+    lookup_cache.put_many(
+        cache_kind,
+        {r["name"]: r for r in results if not r.get("error")},
+        lookup_cache.SUBREDDIT_CACHE_TTL,
+    )
+    by_name = cached | dict(zip(names, results))
+    return [by_name[n] for n in requested]
 
 
 # =============================================================================
 # MCP Tools
 # =============================================================================
 
-@mcp.tool()
+@functools.cache
+def _error_response(message: str) -> str:
+    """Serialized {"error": message} for fixed error messages, built once each."""
+    return jsonutil.dumps({"error": message})
+
+
+@_tool
 def version() -> str:
     """
     Get the version of the Internet Names MCP server.
@@ -442,7 +1282,7 @@ def version() -> str:
     return f"Internet Names MCP Server version {VERSION}"
 
 
-@mcp.tool()
+@_tool
 def get_supported_socials() -> str:
     """
     Get list of supported social media platforms.
@@ -451,12 +1291,12 @@ def get_supported_socials() -> str:
         JSON with list of platform names that can be checked.
         Note: 'subreddit' is checked via check_subreddits(), not check_handles().
     """
-    return json.dumps({
+    return jsonutil.dumps({
         "platforms": ALL_SOCIALS
     })
 
 
-@mcp.tool()
+@_tool
 async def check_domains(
     names: list[str],
     tlds: list[str] | None = None,
@@ -483,7 +1323,7 @@ async def check_domains(
         errors (for timeout/rate_limit issues), and summary.
     """
     if not names:
-        return json.dumps({"error": "No domain names provided"})
+        return _error_response("No domain names provided")
 
     if tlds is None:
         tlds = DEFAULT_TLDS
@@ -491,39 +1331,28 @@ async def check_domains(
     # Validate method
     method = method.lower()
     if method not in ("rdap", "namesilo", "auto"):
-        return json.dumps({"error": f"Invalid method '{method}'. Use 'rdap', 'namesilo', or 'auto'"})
-
-    # Expand names with TLDs, filtering out empty/whitespace names
-    domains = []
-    for name in names:
-        name = name.strip()
-        if not name:
-            continue
-        if "." in name:
-            domains.append(name)
-        else:
-            for tld in tlds:
-                domains.append(f"{name}.{tld}")
+        return jsonutil.dumps({"error": f"Invalid method '{method}'. Use 'rdap', 'namesilo', or 'auto'"})
 
-    # Remove duplicates while preserving order
-    domains = list(dict.fromkeys(domains))
+    # Expand names with TLDs, then normalize case and remove duplicates while
+    # preserving order, so Example.COM and example.com are only looked up once
+    domains = list(dict.fromkeys(d.lower() for d in _expand_domains(names, tlds)))
 
     if not domains:
-        return json.dumps({"error": "No valid domain names after expansion"})
+        return _error_response("No valid domain names after expansion")
 
     # Select lookup method
     api_key = get_namesilo_key()
     use_rdap = False
     if method == "namesilo":
         if not api_key:
-            return json.dumps({"error": "NameSilo API key not configured"})
-        results = _check_domains_internal(domains, api_key)
+            return _error_response("NameSilo API key not configured")
+        results = await _check_domains_internal(domains, api_key)
     elif method == "rdap":
         use_rdap = True
         results = await _check_domains_rdap_async(domains)
     else:  # auto
         if api_key:
-            results = _check_domains_internal(domains, api_key)
+            results = await _check_domains_internal(domains, api_key)
         else:
             use_rdap = True
             results = await _check_domains_rdap_async(domains)
@@ -572,10 +1401,10 @@ async def check_domains(
     if summary:
         response["summary"] = summary
 
-    return json.dumps(response)
+    return jsonutil.dumps(response)
 
 
-@mcp.tool()
+@_tool
 async def check_handles(
     username: str,
     platforms: list[str] | None = None,
@@ -598,7 +1427,7 @@ async def check_handles(
         JSON with available platforms, unavailable platforms (unless only_report_available).
     """
     if not username or not username.strip():
-        return json.dumps({"error": "No username provided"})
+        return _error_response("No username provided")
 
     username = username.strip()
 
@@ -610,14 +1439,14 @@ async def check_handles(
         platforms = [p.lower() for p in platforms]
         # Check if twitter was requested but not available
         if "twitter" in platforms and "twitter" not in supported:
-            return json.dumps({
+            return jsonutil.dumps({
                 "error": "Twitter checking unavailable. Chromium browser failed to install. Try manually: playwright install chromium"
             })
         # Filter to only supported platforms
         platforms = [p for p in platforms if p in supported]
 
     if not platforms:
-        return json.dumps({"error": "No valid platforms specified"})
+        return _error_response("No valid platforms specified")
 
     results = await _check_handles_internal(username, platforms)
 
@@ -627,17 +1456,17 @@ async def check_handles(
     for platform in platforms:
         info = results.get(platform, {"available": None, "error": "Unknown"})
 
-        if info.get("error"):
+        if error := info.get("error"):
             # Treat errors as unavailable with note
-            unavailable_list.append({"platform": platform, "error": info["error"]})
+            unavailable_list.append({"platform": platform, "error": error})
         elif info.get("available"):
             available_list.append(platform)
         else:
             entry = {"platform": platform}
-            if info.get("url"):
-                entry["url"] = info["url"]
-            if info.get("note"):
-                entry["note"] = info["note"]
+            if url := info.get("url"):
+                entry["url"] = url
+            if note := info.get("note"):
+                entry["note"] = note
             unavailable_list.append(entry)
 
     response = {
@@ -647,11 +1476,11 @@ async def check_handles(
     if not only_report_available:
         response["unavailable"] = unavailable_list
 
-    return json.dumps(response)
+    return jsonutil.dumps(response)
 
 
-@mcp.tool()
-def check_subreddits(
+@_tool
+async def check_subreddits(
     names: list[str],
     only_report_available: bool = False
 ) -> str:
@@ -666,25 +1495,26 @@ def check_subreddits(
         JSON with available subreddits, unavailable subreddits (unless only_report_available).
     """
     if not names:
-        return json.dumps({"error": "No subreddit names provided"})
+        return _error_response("No subreddit names provided")
 
-    results = _check_subreddits_internal(names)
+    # Subscriber counts are only reported for taken names
+    results = await _check_subreddits_internal(names, with_metadata=not only_report_available)
 
     available_list = []
     unavailable_list = []
 
     for r in results:
         name = r["name"]
-        if r.get("error"):
-            unavailable_list.append({"name": name, "error": r["error"]})
+        if error := r.get("error"):
+            unavailable_list.append({"name": name, "error": error})
         elif r.get("available"):
             available_list.append(name)
         else:
             entry = {"name": name}
-            if r.get("subscribers"):
-                entry["subscribers"] = r["subscribers"]
-            if r.get("note"):
-                entry["note"] = r["note"]
+            if subscribers := r.get("subscribers"):
+                entry["subscribers"] = subscribers
+            if note := r.get("note"):
+                entry["note"] = note
             unavailable_list.append(entry)
 
     response = {
@@ -694,10 +1524,10 @@ def check_subreddits(
     if not only_report_available:
         response["unavailable"] = unavailable_list
 
-    return json.dumps(response)
+    return jsonutil.dumps(response)
 
 
-@mcp.tool()
+@_tool
 async def check_everything(
     components: list[str],
     tlds: list[str] | None = None,
@@ -740,12 +1570,12 @@ async def check_everything(
         tlds = ["com", "net", "org", "io", "ai"]
 
     if not tlds:
-        return json.dumps({"error": "No TLDs specified"})
+        return _error_response("No TLDs specified")
 
     # Validate method
     method = method.lower()
     if method not in ("rdap", "namesilo", "auto"):
-        return json.dumps({"error": f"Invalid method '{method}'. Use 'rdap', 'namesilo', or 'auto'"})
+        return jsonutil.dumps({"error": f"Invalid method '{method}'. Use 'rdap', 'namesilo', or 'auto'"})
 
     supported = SUPPORTED_PLATFORMS
     if platforms is None:
@@ -754,80 +1584,69 @@ async def check_everything(
         platforms = [p.lower() for p in platforms]
         # Check if twitter was requested but not available
         if "twitter" in platforms and "twitter" not in supported:
-            return json.dumps({
+            return jsonutil.dumps({
                 "error": "Twitter checking unavailable. Chromium browser failed to install. Try manually: playwright install chromium"
             })
         platforms = [p for p in platforms if p in supported]
 
     if not platforms:
-        return json.dumps({"error": "No valid platforms specified"})
-
-    # Generate name combinations from components
-    generated_names = set()
-
-    # Add single components (non-empty after stripping)
-    for comp in components:
-        comp = comp.lower().strip()
-        if comp:
-            generated_names.add(comp)
+        return _error_response("No valid platforms specified")
 
-    # Add concatenations (both orders for 2+ components)
-    if len(components) >= 2:
-        # Clean components for joining
-        clean_components = [c.lower().strip() for c in components if c.strip()]
+    # Generate name combinations from components, cleaning each one once
+    clean_components = [c for c in (comp.lower().strip() for comp in components) if c]
 
-        if clean_components:
-            # All components concatenated in given order
-            concat = "".join(clean_components)
-            generated_names.add(concat)
+    # Single components
+    candidates = list(clean_components)
 
-            # Reverse order
-            reverse_concat = "".join(reversed(clean_components))
-            generated_names.add(reverse_concat)
+    # Concatenations in given and reverse order (for 2+ components)
+    if len(components) >= 2 and clean_components:
+        reversed_components = clean_components[::-1]
+        candidates += ["".join(clean_components), "".join(reversed_components)]
 
-            # Hyphenated versions (only for domains, not handles)
-            if also_include_hyphens:
-                hyphen_concat = "-".join(clean_components)
-                generated_names.add(hyphen_concat)
+        # Hyphenated versions (only for domains, not handles)
+        if also_include_hyphens:
+            candidates += ["-".join(clean_components), "-".join(reversed_components)]
 
-                hyphen_reverse = "-".join(reversed(clean_components))
-                generated_names.add(hyphen_reverse)
-
-    generated_names = list(generated_names)
+    # Deduplicate, keeping first-seen order
+    generated_names = list(dict.fromkeys(candidates))
 
     if not generated_names:
-        return json.dumps({"error": "No valid name components provided"})
+        return _error_response("No valid name components provided")
+
+    # Build all domain combinations, remembering each domain's basename
+    # (duplicate TLDs are dropped so require_all_tlds_available counts right)
+    tlds = list(dict.fromkeys(tlds))
+    tld_suffixes = ["." + tld for tld in tlds]
+    domain_basenames = {
+        name + suffix: name for name in generated_names for suffix in tld_suffixes
+    }
+    all_domains = list(domain_basenames)
 
-    # Build all domain combinations
-    all_domains = []
-    for name in generated_names:
-        for tld in tlds:
-            all_domains.append(f"{name}.{tld}")
+    # When every TLD must be available, stop checking a basename's other
+    # TLDs via RDAP as soon as one of them is taken
+    group_key = _domain_basename if require_all_tlds_available else None
 
     # Select lookup method
     api_key = get_namesilo_key()
     if method == "namesilo":
         if not api_key:
-            return json.dumps({"error": "NameSilo API key not configured"})
-        domain_results = _check_domains_internal(all_domains, api_key)
+            return _error_response("NameSilo API key not configured")
+        domain_results = await _check_domains_internal(all_domains, api_key)
     elif method == "rdap":
-        domain_results = await _check_domains_rdap_async(all_domains)
+        domain_results = await _check_domains_rdap_async(all_domains, group_key=group_key)
     else:  # auto
         if api_key:
-            domain_results = _check_domains_internal(all_domains, api_key)
+            domain_results = await _check_domains_internal(all_domains, api_key)
         else:
-            domain_results = await _check_domains_rdap_async(all_domains)
+            domain_results = await _check_domains_rdap_async(all_domains, group_key=group_key)
 
     # Group results by basename and collect errors
-    basename_results: dict[str, list[DomainResult]] = {}
+    basename_results: defaultdict[str, list[DomainResult]] = defaultdict(list)
     domain_errors = []
     for r in domain_results:
         if r.error:
             domain_errors.append({"domain": r.domain, "error": r.error})
-        # Extract basename from domain
-        basename = r.domain.rsplit(".", 1)[0]
-        if basename not in basename_results:
-            basename_results[basename] = []
+        basename = domain_basenames.get(r.domain) or _domain_basename(r.domain)
         basename_results[basename].append(r)
 
     # Determine which basenames pass the domain check
@@ -860,8 +1679,29 @@ async def check_everything(
     available_handles: dict[str, list[str]] = {}
     unavailable_handles: dict[str, list[dict]] = {}
 
-    for basename in domain_successful_basenames:
-        handle_results = await _check_handles_internal(basename, platforms)
+    # Twitter for all basenames runs in one browser session while the other
+    # platforms are checked for several basenames at a time
+    twitter_task = None
+    if "twitter" in platforms and domain_successful_basenames:
+        twitter_task = asyncio.create_task(_check_twitter_many(domain_successful_basenames))
+
+    other_platforms = [p for p in platforms if p != "twitter"]
+    semaphore = asyncio.Semaphore(HANDLE_CHECK_CONCURRENCY)
+
+    async def check_basename(basename: str) -> dict[str, dict]:
+        async with semaphore:
+            return await _check_handles_internal(basename, other_platforms)
+
+    all_handle_results = await asyncio.gather(
+        *(check_basename(basename) for basename in domain_successful_basenames)
+    )
+    twitter_results = await twitter_task if twitter_task else {}
+
+    for basename, handle_results in zip(domain_successful_basenames, all_handle_results):
+        if "twitter" in platforms:
+            handle_results["twitter"] = twitter_results.get(
+                basename, {"available": None, "error": "No response"}
+            )
 
         available_for_name = []
         unavailable_for_name = []
@@ -869,14 +1709,14 @@ async def check_everything(
         for platform in platforms:
             info = handle_results.get(platform, {"available": None, "error": "Unknown"})
 
-            if info.get("error"):
-                unavailable_for_name.append({"platform": platform, "error": info["error"]})
+            if error := info.get("error"):
+                unavailable_for_name.append({"platform": platform, "error": error})
             elif info.get("available"):
                 available_for_name.append(platform)
             else:
                 entry = {"platform": platform}
-                if info.get("url"):
-                    entry["url"] = info["url"]
+                if url := info.get("url"):
+                    entry["url"] = url
                 unavailable_for_name.append(entry)
 
         if available_for_name:
@@ -919,4 +1759,4 @@ async def check_everything(
     if summary:
         response["summary"] = summary
 
-    return json.dumps(response)
+    return jsonutil.dumps(response)
@@ -744,6 +744,8 @@ async def main_async():
         command=sys.executable,  # Use the same Python that's running this test
         args=["-m", "internet_names_mcp"],
         cwd=str(Path(__file__).parent),
+        # Check live every time: never read (or write) the persistent lookup cache
+        env={**os.environ, "INTERNET_NAMES_NO_CACHE": "1"},
     )
 
     # Connect to the server via stdio (suppress server logs by redirecting to devnull)
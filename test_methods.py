@@ -11,7 +11,13 @@ Usage:
 """
 
 import asyncio
+import os
 import sys
+import time
+from collections import Counter
+
+# Check live every time: never read (or write) the persistent lookup cache
+os.environ["INTERNET_NAMES_NO_CACHE"] = "1"
 
 try:
     from internet_names_mcp.server import check_domains
@@ -192,18 +198,24 @@ async def main():
     print(f"  - Likely available: {len(LIKELY_AVAILABLE)}")
     print()
 
-    # Run RDAP check
-    print("Running RDAP check...")
-    rdap_json = await check_domains(domains, tlds=[], method="rdap")
+    # The two methods hit different servers, so run them concurrently
+    async def timed_check(method: str) -> tuple[str, float]:
+        start = time.perf_counter()
+        result = await check_domains(domains, tlds=[], method=method)
+        return result, time.perf_counter() - start
+
+    print("Running RDAP and NameSilo checks...")
+    (rdap_json, rdap_elapsed), (namesilo_json, namesilo_elapsed) = await asyncio.gather(
+        timed_check("rdap"), timed_check("namesilo")
+    )
+    print(f"  RDAP: {rdap_elapsed:.2f}s, NameSilo: {namesilo_elapsed:.2f}s")
+
     rdap_results = parse_results(rdap_json)
 
     if "_error" in rdap_results:
         print(f"RDAP fatal error: {rdap_results['_error']}")
         return 1
 
-    # Run NameSilo check
-    print("Running NameSilo check...")
-    namesilo_json = await check_domains(domains, tlds=[], method="namesilo")
     namesilo_results = parse_results(namesilo_json)
 
     if "_error" in namesilo_results:
@@ -212,17 +224,36 @@ async def main():
 
     print()
 
-    # Collect and display errors first
+    # One pass over the domains collects errors and builds the results table
     rdap_errors = []
     namesilo_errors = []
+    table_rows = []
     for domain in domains:
         rdap_status = rdap_results.get(domain, "missing")
         namesilo_status = namesilo_results.get(domain, "missing")
+
+        # Show error code in table (full error is logged in the ERRORS section)
         if rdap_status.startswith("error:"):
             rdap_errors.append((domain, rdap_status[6:]))
+            rdap_display = "ERROR"
+        else:
+            rdap_display = rdap_status
+
         if namesilo_status.startswith("error:"):
             namesilo_errors.append((domain, namesilo_status[6:]))
+            namesilo_display = "ERROR"
+        else:
+            namesilo_display = namesilo_status
+
+        # Mark discrepancies
+        marker = ""
+        if rdap_display != "ERROR" and namesilo_display != "ERROR":
+            if rdap_display != namesilo_display:
+                marker = " ❌ MISMATCH"
+
+        table_rows.append(f"{domain:<35} {rdap_display:<15} {namesilo_display:<15}{marker}")
 
+    # Print the errors collected above, ahead of the results table
     if rdap_errors or namesilo_errors:
         print("=" * 70)
         print("ERRORS")
@@ -254,35 +285,13 @@ async def main():
     print("=" * 70)
     print(f"{'Domain':<35} {'RDAP':<15} {'NameSilo':<15}")
     print("-" * 70)
-
-    for domain in domains:
-        rdap_status = rdap_results.get(domain, "missing")
-        namesilo_status = namesilo_results.get(domain, "missing")
-
-        # Show error code in table (full error already logged above)
-        if rdap_status.startswith("error:"):
-            rdap_display = "ERROR"
-        else:
-            rdap_display = rdap_status
-
-        if namesilo_status.startswith("error:"):
-            namesilo_display = "ERROR"
-        else:
-            namesilo_display = namesilo_status
-
-        # Mark discrepancies
-        marker = ""
-        if rdap_display != "ERROR" and namesilo_display != "ERROR":
-            if rdap_display != namesilo_display:
-                marker = " ❌ MISMATCH"
-
-        print(f"{domain:<35} {rdap_display:<15} {namesilo_display:<15}{marker}")
+    print("\n".join(table_rows))
 
     # Summary
-    rdap_avail = sum(1 for s in rdap_results.values() if s == "available")
-    rdap_taken = sum(1 for s in rdap_results.values() if s == "taken")
-    namesilo_avail = sum(1 for s in namesilo_results.values() if s == "available")
-    namesilo_taken = sum(1 for s in namesilo_results.values() if s == "taken")
+    rdap_counts = Counter(rdap_results.values())
+    namesilo_counts = Counter(namesilo_results.values())
+    rdap_avail, rdap_taken = rdap_counts["available"], rdap_counts["taken"]
+    namesilo_avail, namesilo_taken = namesilo_counts["available"], namesilo_counts["taken"]
 
     print()
     print("=" * 70)
@@ -7,8 +7,12 @@ Usage:
     python test_rdap.py
 """
 
+import os
 import sys
 
+# Check live every time: never read (or write) the persistent lookup cache
+os.environ["INTERNET_NAMES_NO_CACHE"] = "1"
+
 try:
     from internet_names_mcp.server import _check_domains_rdap
     from internet_names_mcp.rdap_bootstrap import get_supported_tlds, refresh_bootstrap
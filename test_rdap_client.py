@@ -28,10 +28,18 @@ except ImportError as e:
     sys.exit(1)
 
 import asyncio
+import hashlib
+import os
 import random
 import string
+import tempfile
 import time
 from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import patch
+
+# Check live every time: never read (or write) the persistent lookup cache
+os.environ["INTERNET_NAMES_NO_CACHE"] = "1"
 
 from internet_names_mcp.rdap_client import (
     AsyncRDAPClient,
@@ -42,6 +50,10 @@ from internet_names_mcp.rdap_client import (
     _parse_retry_after,
     check_domains_async,
 )
+from internet_names_mcp import rdap_bootstrap, server
+from internet_names_mcp.rdap_bootstrap import _parse_max_age
+
+import publish  # Repo-root release script
 
 
 def generate_unique_name() -> str:
@@ -143,6 +155,34 @@ def run_unit_tests(runner: TestRunner):
         "parses HTTP date format", result is not None and isinstance(result, float)
     )
 
+    # =========================================================================
+    # _parse_max_age (rdap_bootstrap)
+    # =========================================================================
+    runner.section("_parse_max_age")
+
+    cases = [
+        # (Cache-Control header, expected max-age)
+        ("max-age=3600", 3600),
+        ("public, max-age=86400", 86400),
+        ("MAX-AGE=60", 60),
+        ("max-age=0", 0),
+        ("s-maxage=60, max-age=300", 300),
+        ("max-age=300, s-maxage=60", 300),
+        ("s-maxage=60", None),
+        ('max-age="600"', 600),
+        ("max-age = 120 , public", 120),
+        ("max-age=abc", None),
+        ("max-age=abc, max-age=90", 90),
+        ("max-age=", None),
+        ("max-age=-5", None),
+        ("x-max-age=5", None),
+        ("no-cache, no-store", None),
+        ("", None),
+    ]
+    for header, expected in cases:
+        result = _parse_max_age(header)
+        runner.test(f"{header!r} -> {expected}", result == expected, f"got {result}")
+
     # =========================================================================
     # DomainResult
     # =========================================================================
@@ -193,6 +233,172 @@ def run_unit_tests(runner: TestRunner):
     )
 
 
+def run_namesilo_parser_tests(runner: TestRunner):
+    """Test NameSilo reply parsing against each reply shape (no network)."""
+
+    # =========================================================================
+    # _parse_namesilo_reply
+    # =========================================================================
+    runner.section("_parse_namesilo_reply")
+
+    D = server.DomainResult
+    cases = [
+        # (description, reply, expected results)
+        ("available list with prices",
+         {"available": [{"domain": "a.com", "price": 17.29}, {"domain": "b.io", "price": "34.99"}]},
+         [D("a.com", True, 17.29), D("b.io", True, 34.99)]),
+        ("single available nested under domain",
+         {"available": {"domain": {"domain": "a.com", "price": 17.29}}},
+         [D("a.com", True, 17.29)]),
+        ("single unavailable as a string",
+         {"unavailable": {"domain": "taken.com"}},
+         [D("taken.com", False)]),
+        ("unavailable list of strings",
+         {"unavailable": ["x.com", "y.net"]},
+         [D("x.com", False), D("y.net", False)]),
+        ("unavailable list nested under domain",
+         {"unavailable": {"domain": ["x.com", "y.net"]}},
+         [D("x.com", False), D("y.net", False)]),
+        ("unavailable list of dicts drops any price",
+         {"unavailable": [{"domain": "x.com", "price": 9.99}]},
+         [D("x.com", False)]),
+        ("single invalid domain is an error",
+         {"invalid": {"domain": "bad..com"}},
+         [D("bad..com", False, error="Invalid domain name")]),
+        ("mixed sections in section order",
+         {"invalid": ["bad..com"], "unavailable": {"domain": "taken.com"},
+          "available": {"domain": {"domain": "free.com", "price": 10}}},
+         [D("free.com", True, 10.0), D("taken.com", False),
+          D("bad..com", False, error="Invalid domain name")]),
+        ("available without a price",
+         {"available": [{"domain": "a.com"}]},
+         [D("a.com", True)]),
+        ("empty reply",
+         {},
+         []),
+        ("unexpected section types are ignored",
+         {"available": 5, "unavailable": {"domain": None}, "invalid": [None, 3]},
+         []),
+    ]
+    for description, reply, expected in cases:
+        results = server._parse_namesilo_reply(reply)
+        runner.test(description, results == expected, f"got {results}")
+
+
+def run_bootstrap_refresh_tests(runner: TestRunner):
+    """Test refresh_bootstrap's conditional requests against a stub IANA (no network)."""
+
+    # =========================================================================
+    # refresh_bootstrap - validators
+    # =========================================================================
+    runner.section("refresh_bootstrap - validators")
+
+    body = b'{"services": [[["com"], ["https://rdap.example.com/"]]]}'
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v2"':
+            return httpx.Response(304, headers={"ETag": '"v2"'})
+        # Ignores the old validator and resends the same body with new ones
+        return httpx.Response(200, content=body, headers={
+            "ETag": '"v2"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+        })
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            httpx.Client(transport=httpx.MockTransport(handler)) as client, \
+            patch.object(rdap_bootstrap, "BOOTSTRAP_CACHE_PATH", Path(tmp) / "bootstrap.json"), \
+            patch.object(rdap_bootstrap, "_get_http_client", lambda: client), \
+            patch.object(rdap_bootstrap, "_mem_cache", None), \
+            patch.object(rdap_bootstrap, "_mem_cache_mtime", None):
+        rdap_bootstrap._save_cache({
+            "etag": '"v1"',
+            "last_modified": "",
+            "content_hash": hashlib.blake2b(body, digest_size=16).hexdigest(),
+            "expires": 0,
+            "services": {"com": ["https://rdap.example.com/"]},
+        })
+
+        updated = rdap_bootstrap.refresh_bootstrap(force=True)
+        cache = rdap_bootstrap._load_cache()
+        runner.test("same body is not reparsed", updated is False)
+        runner.test("same body stores the new ETag", cache["etag"] == '"v2"', f"got {cache['etag']}")
+        runner.test(
+            "same body stores the new Last-Modified",
+            cache["last_modified"] == "Wed, 01 Jan 2025 00:00:00 GMT",
+            f"got {cache['last_modified']}",
+        )
+
+        rdap_bootstrap.refresh_bootstrap(force=True)
+        runner.test("next refresh sends the new ETag", sent == ['"v1"', '"v2"'], f"got {sent}")
+
+
+def run_publish_tests(runner: TestRunner):
+    """Test publish.py's version rewriting on temporary files (no network)."""
+
+    # =========================================================================
+    # publish._write_version
+    # =========================================================================
+    runner.section("publish._write_version")
+
+    original = '# Caf\u00e9 \u2615\nversion = "0.1.8"\n\nVERSION = "0.1.8"\n'
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "pyproject.toml"
+
+        def write_version(new_version: str) -> str:
+            content = path.read_bytes().decode()
+            matches = list(publish.VERSION_RE.finditer(content))
+            publish._write_version(path, content, matches, new_version)
+            return path.read_text(encoding="utf-8")
+
+        # Same length: patched in place (multi-byte text before the versions)
+        path.write_text(original, encoding="utf-8")
+        with patch.object(Path, "write_bytes", side_effect=AssertionError("rewrote file")) as write_bytes:
+            try:
+                result = write_version("0.1.9")
+            except AssertionError as e:
+                result = str(e)
+        runner.test(
+            "same length: versions patched in place",
+            result == original.replace("0.1.8", "0.1.9") and not write_bytes.called,
+            f"got {result!r}",
+        )
+
+        # Different length: the whole file is rewritten
+        path.write_text(original, encoding="utf-8")
+        with patch.object(Path, "write_bytes", autospec=True, side_effect=Path.write_bytes) as write_bytes:
+            result = write_version("0.1.10")
+        runner.test(
+            "longer version: file rewritten",
+            result == original.replace("0.1.8", "0.1.10") and write_bytes.call_count == 1,
+            f"got {result!r}",
+        )
+
+        path.write_text(original.replace("0.1.8", "0.1.10"), encoding="utf-8")
+        result = write_version("0.2.0")
+        runner.test(
+            "shorter version: file rewritten without leftovers",
+            result == original.replace("0.1.8", "0.2.0"),
+            f"got {result!r}",
+        )
+
+        # update_versions checks every file before writing any of them
+        other = Path(tmp) / "server.py"
+        other.write_text("# no version here\n", encoding="utf-8")
+        path.write_text(original, encoding="utf-8")
+        with patch.object(publish, "VERSION_FILES", (path, other)):
+            try:
+                publish.update_versions("0.1.9")
+                raised = False
+            except ValueError:
+                raised = True
+        runner.test(
+            "missing version leaves other files untouched",
+            raised and path.read_text(encoding="utf-8") == original,
+            f"raised={raised}, content={path.read_text(encoding='utf-8')!r}",
+        )
+
+
 async def run_rate_limiter_tests(runner: TestRunner):
     """Test HostRateLimiter behavior."""
 
@@ -277,6 +483,164 @@ async def run_rate_limiter_tests(runner: TestRunner):
     limiter3 = await registry.get_limiter("https://rdap.other.com/domain/test.com")
     runner.test("returns different limiter for different host", limiter1 is not limiter3)
 
+    # =========================================================================
+    # Subreddit token bucket - pause (fake clock, no real sleeping)
+    # =========================================================================
+    runner.section("Subreddit _TokenBucket - pause")
+
+    clock = [0.0]
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    with patch.object(server.time, "monotonic", lambda: clock[0]), \
+            patch.object(server.asyncio, "sleep", fake_sleep):
+        bucket = server._TokenBucket(capacity=5, rate=2.0)
+
+        # Time that passed before the pause must not shorten it
+        clock[0] = 10.0
+        bucket.pause(30)
+        await bucket.acquire()
+        runner.test("first acquire sleeps for the reset", sleeps == [30.0], f"got {sleeps}")
+
+        bucket = server._TokenBucket(capacity=5, rate=2.0)
+        sleeps.clear()
+        clock[0] = 20.0
+        bucket.pause(30)
+        clock[0] = 25.0
+        await bucket.acquire()
+        runner.test("sleep shrinks by time spent since the pause", sleeps == [25.0], f"got {sleeps}")
+
+        # A pause shorter than the existing debt doesn't cut it short
+        bucket = server._TokenBucket(capacity=1, rate=1.0)
+        sleeps.clear()
+        bucket.pause(10)
+        bucket.pause(2)
+        await bucket.acquire()
+        runner.test("shorter pause keeps the longer wait", sleeps == [10.0], f"got {sleeps}")
+
+
+async def run_handle_probe_tests(runner: TestRunner):
+    """Test Sherlock-rule handle probes against stubbed HTTP responses."""
+
+    # =========================================================================
+    # _classify_probe_response
+    # =========================================================================
+    runner.section("_classify_probe_response")
+
+    request = httpx.Request("GET", "https://example.com/alice")
+    cases = [
+        # (description, site, response, expected available)
+        ("status_code: 404 is available",
+         {"errorType": "status_code"}, httpx.Response(404, request=request), True),
+        ("status_code: 200 is taken",
+         {"errorType": "status_code"}, httpx.Response(200, request=request), False),
+        ("status_code: listed errorCode is available",
+         {"errorType": "status_code", "errorCode": [200, 410]}, httpx.Response(200, request=request), True),
+        ("message: errorMsg in body is available",
+         {"errorType": "message", "errorMsg": "No such user"},
+         httpx.Response(200, text="<p>No such user</p>", request=request), True),
+        ("message: any of several errorMsgs",
+         {"errorType": "message", "errorMsg": ["Gone", "Missing"]},
+         httpx.Response(200, text="Missing profile", request=request), True),
+        ("message: profile page is taken",
+         {"errorType": "message", "errorMsg": "No such user"},
+         httpx.Response(200, text="<h1>alice</h1>", request=request), False),
+        ("response_url: redirect is available",
+         {"errorType": "response_url"}, httpx.Response(302, request=request), True),
+        ("response_url: 200 is taken",
+         {"errorType": "response_url"}, httpx.Response(200, request=request), False),
+        ("message + status_code: either rule marks available",
+         {"errorType": ["message", "status_code"], "errorMsg": "No such user"},
+         httpx.Response(404, text="oops", request=request), True),
+    ]
+    for description, site, response, expected in cases:
+        result = server._classify_probe_response(site, response)
+        runner.test(description, result is expected, f"got {result}")
+
+    # =========================================================================
+    # _probe_platform (MockTransport, no network)
+    # =========================================================================
+    runner.section("_probe_platform")
+
+    seen_methods = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_methods.append(request.method)
+        path = request.url.path
+        if path == "/missing":
+            return httpx.Response(404)
+        if path == "/moved":
+            return httpx.Response(302, headers={"Location": "https://probe.test/signup"})
+        if path == "/waf":
+            return httpx.Response(403, text='<span id="challenge-error-text">')
+        if path == "/slow":
+            raise httpx.ConnectTimeout("timed out", request=request)
+        if path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, text="<h1>profile</h1>")
+
+    status_site = {"url": "https://probe.test/{}", "errorType": "status_code"}
+    message_site = {"url": "https://probe.test/{}", "errorType": "message", "errorMsg": "No such user"}
+    redirect_site = {"url": "https://probe.test/{}", "errorType": "response_url"}
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        result = await server._probe_platform(client, status_site, "missing")
+        runner.test("status_code: 404 is available", result == {"available": True}, f"got {result}")
+        runner.test("status_code: probes with HEAD", seen_methods[-1] == "HEAD", f"got {seen_methods}")
+
+        result = await server._probe_platform(client, status_site, "alice")
+        runner.test(
+            "status_code: 200 is taken with profile URL",
+            result == {"available": False, "url": "https://probe.test/alice"},
+            f"got {result}",
+        )
+
+        result = await server._probe_platform(client, message_site, "alice")
+        runner.test("message: probes with GET", seen_methods[-1] == "GET", f"got {seen_methods}")
+        runner.test("message: profile page is taken", result["available"] is False, f"got {result}")
+
+        result = await server._probe_platform(client, redirect_site, "moved")
+        runner.test("response_url: redirect is available", result == {"available": True}, f"got {result}")
+
+        result = await server._probe_platform(client, redirect_site, "alice")
+        runner.test("response_url: 200 is taken", result["available"] is False, f"got {result}")
+
+        result = await server._probe_platform(client, status_site, "waf")
+        runner.test(
+            "bot detection page is an error",
+            result == {"available": None, "error": "Blocked by bot detection"},
+            f"got {result}",
+        )
+
+        result = await server._probe_platform(client, status_site, "slow")
+        runner.test("timeout is an error", result == {"available": None, "error": "Timeout Error"}, f"got {result}")
+
+        result = await server._probe_platform(client, status_site, "down")
+        runner.test(
+            "connection failure is an error",
+            result["available"] is None and result["error"].startswith("Error Connecting"),
+            f"got {result}",
+        )
+
+        calls = len(seen_methods)
+        result = await server._probe_platform(
+            client, {**status_site, "regexCheck": "^[a-z]+$"}, "Bad Name!"
+        )
+        runner.test(
+            "regexCheck mismatch is rejected without a request",
+            result["available"] is None and len(seen_methods) == calls,
+            f"got {result}",
+        )
+
+        result = await server._probe_platform(client, {**status_site, "errorType": "captcha"}, "alice")
+        runner.test(
+            "unknown errorType is an error",
+            result["available"] is None and "Unknown error type" in result["error"],
+            f"got {result}",
+        )
+
 
 async def run_integration_tests(runner: TestRunner):
     """Run integration tests that require network calls."""
@@ -366,6 +730,32 @@ async def run_integration_tests(runner: TestRunner):
             f"took {elapsed:.2f}s",
         )
 
+        runner.test(
+            "batch preserves input order",
+            [r.domain for r in results] == domains,
+        )
+
+        # Streaming variant yields the same results in completion order
+        streamed = [r async for r in client.iter_check_domains(domains)]
+        runner.test(
+            "iter_check_domains yields every domain",
+            sorted(r.domain for r in streamed) == sorted(domains),
+        )
+        runner.test(
+            "iter_check_domains matches batch statuses",
+            {r.domain: r.status for r in streamed} == {r.domain: r.status for r in results},
+        )
+
+    # One worker per host so the .com result lands before .net is requested
+    async with AsyncRDAPClient(timeout=15.0, max_retries=2, max_concurrent_per_host=1) as client:
+        domains = ["google.com", "google.net", f"{unique_name}.com"]
+        results = await client.check_domains(domains, group_key=lambda d: d.rsplit(".", 1)[0])
+        runner.test(
+            "group_key skips the rest of a taken group",
+            [r.domain for r in results] == ["google.com", f"{unique_name}.com"],
+            f"got {[r.domain for r in results]}",
+        )
+
     # =========================================================================
     # check_domains_async convenience function
     # =========================================================================
@@ -415,10 +805,16 @@ async def main_async():
 
     # Unit tests (no network)
     run_unit_tests(runner)
+    run_namesilo_parser_tests(runner)
+    run_bootstrap_refresh_tests(runner)
+    run_publish_tests(runner)
 
     # Rate limiter tests (no network, uses asyncio)
     await run_rate_limiter_tests(runner)
 
+    # Handle probe tests (no network, stubbed HTTP)
+    await run_handle_probe_tests(runner)
+
     # Integration tests (network required)
     await run_integration_tests(runner)
 
@@ -29,10 +29,17 @@ except ImportError as e:
 
 import asyncio
 import json
+import os
 import random
 import string
+import tempfile
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
+from pathlib import Path
+
+# Check live every time: never read (or write) the persistent lookup cache
+os.environ["INTERNET_NAMES_NO_CACHE"] = "1"
 
 
 def run_sync(coro):
@@ -40,12 +47,30 @@ def run_sync(coro):
     return asyncio.run(coro)
 
 
+@contextmanager
+def seeded_lookup_cache(kind: str, values: dict[str, dict]):
+    """Enable the lookup cache on a temporary database holding only values."""
+    saved = (lookup_cache.CACHE_ENABLED, lookup_cache._connection, lookup_cache._get_cache_path)
+    with tempfile.TemporaryDirectory() as tmp:
+        lookup_cache.CACHE_ENABLED = True
+        lookup_cache._connection = None
+        lookup_cache._get_cache_path = lambda: Path(tmp) / "lookups.sqlite3"
+        try:
+            lookup_cache.put_many(kind, values, 3600)
+            yield
+        finally:
+            if lookup_cache._connection is not None:
+                lookup_cache._connection.close()
+            lookup_cache.CACHE_ENABLED, lookup_cache._connection, lookup_cache._get_cache_path = saved
+
+
 def generate_unique_name() -> str:
     """Generate a unique name unlikely to be taken."""
     suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=10))
     return f"xyztest{suffix}"
 
 
+from internet_names_mcp import lookup_cache
 from internet_names_mcp.server import (
     get_supported_socials,
     check_domains,
@@ -274,7 +299,7 @@ def run_offline_tests(runner: TestRunner):
     runner.section("check_subreddits - edge cases")
 
     # Empty list
-    result = check_subreddits([])
+    result = run_sync(check_subreddits([]))
     runner.test_json("empty list returns error", result, {
         "has error": lambda d: "error" in d,
     })
@@ -368,6 +393,17 @@ def run_online_tests(runner: TestRunner):
     else:
         runner.test("(skipped) rdap entry structure", True, "no available domains")
 
+    # A partly cached batch keeps input order (the middle domain is cached)
+    ordered = [f"a{unique_name}", unique_name, f"z{unique_name}"]
+    seed = {f"{unique_name}.com": {"domain": f"{unique_name}.com", "available": True}}
+    with seeded_lookup_cache("rdap", seed):
+        result = run_sync(check_domains(ordered, tlds=["com"], method="rdap"))
+    runner.test_json("rdap: partly cached results keep input order", result, {
+        "available in input order": lambda d: [e["domain"] for e in d["available"]] == [
+            f"{n}.com" for n in ordered
+        ],
+    })
+
     # =========================================================================
     # check_domains - method="namesilo"
     # =========================================================================
@@ -508,7 +544,7 @@ def run_online_tests(runner: TestRunner):
     runner.section("check_subreddits - API tests")
 
     # Check a known existing subreddit
-    result = check_subreddits(["programming"])
+    result = run_sync(check_subreddits(["programming"]))
     data = runner.test_json("r/programming exists", result, {
         "has available": lambda d: "available" in d,
         "has unavailable": lambda d: "unavailable" in d,
@@ -526,14 +562,22 @@ def run_online_tests(runner: TestRunner):
             runner.test("subscribers is int", isinstance(prog.get("subscribers"), int))
 
     # Check likely available subreddit
-    result = check_subreddits([unique_name])
+    result = run_sync(check_subreddits([unique_name]))
     runner.test_json("unique subreddit is available", result, {
         "has available": lambda d: "available" in d,
         "unique in available": lambda d: unique_name in d["available"],
     })
 
+    # A partly cached batch keeps input order (the middle name is cached)
+    ordered = [f"a{unique_name}", unique_name, f"z{unique_name}"]
+    with seeded_lookup_cache("subreddit", {unique_name: {"name": unique_name, "available": True}}):
+        result = run_sync(check_subreddits(ordered))
+    runner.test_json("partly cached results keep input order", result, {
+        "available in input order": lambda d: d["available"] == ordered,
+    })
+
     # Test r/ prefix stripping
-    result = check_subreddits(["r/programming"])
+    result = run_sync(check_subreddits(["r/programming"]))
     data = runner.test_json("r/ prefix is stripped", result, {
         "programming in unavailable": lambda d: any(
             (isinstance(e, dict) and e.get("name") == "programming")
@@ -542,7 +586,7 @@ def run_online_tests(runner: TestRunner):
     })
 
     # Test only_report_available
-    result = check_subreddits(["programming"], only_report_available=True)
+    result = run_sync(check_subreddits(["programming"], only_report_available=True))
     runner.test_json("only_report_available omits unavailable", result, {
         "no unavailable key": lambda d: "unavailable" not in d,
     })
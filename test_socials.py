@@ -63,6 +63,8 @@ async def main_async(username: str, platforms: list[str]) -> int:
         command=sys.executable,
         args=["-m", "internet_names_mcp"],
         cwd=str(Path(__file__).parent),
+        # Check live every time: never read (or write) the persistent lookup cache
+        env={**os.environ, "INTERNET_NAMES_NO_CACHE": "1"},
     )
 
     # Suppress server stderr